@@ -7,12 +7,13 @@ from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
 import logging
-from typing import Any, cast
+from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.recent_history import RecentState
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -34,7 +35,7 @@ from homeassistant.helpers.event import (
     async_track_point_in_utc_time,
     async_track_state_change_event,
 )
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
@@ -62,35 +63,66 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_stream)
 
 
+def _get_significant_states_json_fragments(
+    hass: HomeAssistant,
+    recent_states: dict[str, list[RecentState]] | None,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> tuple[dict[str, json_fragment], float]:
+    """Fetch significant states from the recent history or the database."""
+    if recent_states is not None:
+        return history.get_recent_significant_states_json_fragments(
+            hass,
+            recent_states,
+            start_time,
+            end_time,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    return history.get_significant_states_json_fragments(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    )
+
+
 def _ws_get_significant_states(
     hass: HomeAssistant,
     msg_id: int,
+    recent_states: dict[str, list[RecentState]] | None,
     start_time: dt,
     end_time: dt | None,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+    states, _ = _get_significant_states_json_fragments(
+        hass,
+        recent_states,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
     )
+    return json_bytes(messages.result_message(msg_id, states))
 
 
 @websocket_api.websocket_command(
@@ -160,6 +192,7 @@ async def ws_get_history_during_period(
             _ws_get_significant_states,
             hass,
             msg["id"],
+            history.async_get_recent_states(hass, entity_ids, start_time),
             start_time,
             end_time,
             entity_ids,
@@ -172,7 +205,7 @@ async def ws_get_history_during_period(
 
 
 def _generate_stream_message(
-    states: dict[str, list[dict[str, Any]]],
+    states: dict[str, list[dict[str, Any]]] | dict[str, json_fragment],
     start_day: dt,
     end_day: dt,
 ) -> dict[str, Any]:
@@ -200,7 +233,7 @@ def _generate_websocket_response(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    states: dict[str, list[dict[str, Any]]],
+    states: dict[str, list[dict[str, Any]]] | dict[str, json_fragment],
 ) -> bytes:
     """Generate a websocket response."""
     return json_bytes(
@@ -213,9 +246,10 @@ def _generate_websocket_response(
 def _generate_historical_response(
     hass: HomeAssistant,
     msg_id: int,
+    recent_states: dict[str, list[RecentState]] | None,
     start_time: dt,
     end_time: dt,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
@@ -223,30 +257,17 @@ def _generate_historical_response(
     send_empty: bool,
 ) -> tuple[float, dt | None, bytes | None]:
     """Generate a historical response."""
-    states = cast(
-        dict[str, list[dict[str, Any]]],
-        history.get_significant_states(
-            hass,
-            start_time,
-            end_time,
-            entity_ids,
-            None,
-            include_start_time_state,
-            significant_changes_only,
-            minimal_response,
-            no_attributes,
-            True,
-        ),
+    states, last_time_ts = _get_significant_states_json_fragments(
+        hass,
+        recent_states,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
     )
-    last_time_ts = 0.0
-    for state_list in states.values():
-        if (
-            state_list
-            and (state_last_time := state_list[-1][COMPRESSED_STATE_LAST_UPDATED])
-            > last_time_ts
-        ):
-            last_time_ts = cast(float, state_last_time)
-
     if last_time_ts == 0:
         # If we did not send any states ever, we need to send an empty response
         # so the websocket client knows it should render/process/consume the
@@ -270,7 +291,7 @@ async def _async_send_historical_states(
     msg_id: int,
     start_time: dt,
     end_time: dt,
-    entity_ids: list[str] | None,
+    entity_ids: list[str],
     include_start_time_state: bool,
     significant_changes_only: bool,
     minimal_response: bool,
@@ -283,6 +304,7 @@ async def _async_send_historical_states(
         _generate_historical_response,
         hass,
         msg_id,
+        history.async_get_recent_states(hass, entity_ids, start_time),
         start_time,
         end_time,
         entity_ids,
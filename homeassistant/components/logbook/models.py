@@ -45,25 +45,33 @@ class LazyEventPartialState:
     ) -> None:
         """Init the lazy event."""
         self.row = row
+        self._event_data_cache = event_data_cache
+
+    @cached_property
+    def data(self) -> dict[str, Any]:
+        """Return the event data.
+
+        The event data is only decoded when it is accessed as most rows
+        are only needed for their state or context.
+        """
+        row = self.row
         # We need to explicitly check for the row is EventAsRow as the unhappy path
         # to fetch row[DATA_POS] for Row is very expensive
         if type(row) is EventAsRow:
             # If its an EventAsRow we can avoid the whole
             # json decode process as we already have the data
-            self.data = row[DATA_POS]
-            return
+            return row[DATA_POS]  # type: ignore[return-value]
         if TYPE_CHECKING:
             source = cast(str, row[EVENT_DATA_POS])
         else:
             source = row[EVENT_DATA_POS]
         if not source:
-            self.data = {}
-        elif event_data := event_data_cache.get(source):
-            self.data = event_data
-        else:
-            self.data = event_data_cache[source] = cast(
-                dict[str, Any], json_loads(source)
-            )
+            return {}
+        event_data_cache = self._event_data_cache
+        if event_data := event_data_cache.get(source):
+            return event_data
+        event_data_cache[source] = event_data = cast(dict[str, Any], json_loads(source))
+        return event_data
 
     @cached_property
     def event_type(self) -> EventType[Any] | str | None:
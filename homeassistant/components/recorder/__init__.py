@@ -51,16 +51,19 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 5
+DEFAULT_RECENT_HISTORY_MAX_STATES = 20000
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
+CONF_DB_PARTITIONING = "db_partitioning"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_RECENT_HISTORY_MAX_STATES = "recent_history_max_states"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -113,6 +116,11 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_DB_PARTITIONING, default=False): cv.boolean,
+                    vol.Optional(
+                        CONF_RECENT_HISTORY_MAX_STATES,
+                        default=DEFAULT_RECENT_HISTORY_MAX_STATES,
+                    ): cv.positive_int,
                 }
             ),
         )
@@ -161,10 +169,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         uri=db_url,
         db_max_retries=db_max_retries,
         db_retry_wait=db_retry_wait,
+        db_partitioning=conf[CONF_DB_PARTITIONING],
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        recent_history_max_states=conf[CONF_RECENT_HISTORY_MAX_STATES],
     )
     get_instance.cache_clear()
+    await instance.async_load_purge_checkpoint()
     instance.async_initialize()
     instance.async_register()
     instance.start()
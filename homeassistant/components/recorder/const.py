@@ -54,6 +54,15 @@ ATTR_APPLY_FILTER = "apply_filter"
 
 KEEPALIVE_TIME = 30
 
+# The time in seconds a purge task may spend deleting rows before it
+# requeues itself so pending events can be committed
+PURGE_TIME_BUDGET = 1.0
+
+# The purge checkpoint is stored so an unfinished purge resumes after a restart
+PURGE_CHECKPOINT_STORAGE_KEY = "recorder.purge_checkpoint"
+PURGE_CHECKPOINT_STORAGE_VERSION = 1
+PURGE_CHECKPOINT_SAVE_DELAY = 10
+
 CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
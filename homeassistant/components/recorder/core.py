@@ -44,12 +44,13 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
 )
 from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 import homeassistant.util.dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
-from . import migration, statistics
+from . import migration, partition, statistics
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -61,6 +62,9 @@ from .const import (
     MIN_AVAILABLE_MEMORY_FOR_QUEUE_BACKLOG,
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
+    PURGE_CHECKPOINT_SAVE_DELAY,
+    PURGE_CHECKPOINT_STORAGE_KEY,
+    PURGE_CHECKPOINT_STORAGE_VERSION,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     SupportedDialect,
@@ -87,7 +91,9 @@ from .migration import (
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import get_migration_changes
+from .recent_history import RecentHistory
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -102,12 +108,14 @@ from .tasks import (
     ClearStatisticsTask,
     CommitTask,
     CompileMissingStatisticsTask,
+    CreatePartitionsTask,
     DatabaseLockTask,
     ImportStatisticsTask,
     KeepAliveTask,
     PerodicCleanupTask,
     PurgeTask,
     RecorderTask,
+    RollUpStatisticsTask,
     StatisticsTask,
     StopTask,
     SynchronizeTask,
@@ -171,8 +179,10 @@ class Recorder(threading.Thread):
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
+        db_partitioning: bool,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        recent_history_max_states: int,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -190,6 +200,10 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        # Create tables partitioned by day when creating a new database
+        self.db_partitioning = db_partitioning
+        # The database has tables partitioned by day
+        self.partitioned = False
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -212,7 +226,21 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
-
+        # States are written with a bulk insert at commit time
+        # instead of being added to the session when the database
+        # can return the ids of rows inserted with executemany
+        # (SQLite 3.35+, PostgreSQL and MariaDB 10.5+, but not MySQL)
+        self.bulk_insert_states = False
+
+        self.recent_history = RecentHistory(recent_history_max_states)
+        # The progress of the running or last purge, only written by
+        # the recorder thread and saved as a checkpoint so an unfinished
+        # purge is resumed after a restart
+        self.purge_progress: PurgeProgress | None = None
+        self._purge_checkpoint_store: Store[dict[str, Any]] = Store(
+            hass, PURGE_CHECKPOINT_STORAGE_VERSION, PURGE_CHECKPOINT_STORAGE_KEY
+        )
+        self._purge_checkpoint_saved = False
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
         self.event_data_manager = EventDataManager(self)
@@ -281,6 +309,10 @@ class Recorder(threading.Thread):
     def set_enable(self, enable: bool) -> None:
         """Enable or disable recording events and states."""
         self.enabled = enable
+        if not enable:
+            # States are not recorded while disabled so the
+            # recent history would no longer match the database
+            self.recent_history.async_clear()
 
     @callback
     def async_start_executor(self) -> None:
@@ -303,6 +335,7 @@ class Recorder(threading.Thread):
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
         queue_put = self._queue.put_nowait
+        recent_history_add = self.recent_history.async_add
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -314,11 +347,15 @@ class Recorder(threading.Thread):
                 entity_id := event.data.get(ATTR_ENTITY_ID)
             ):
                 queue_put(event)
+                if event.event_type == EVENT_STATE_CHANGED and self.enabled:
+                    recent_history_add(event)
                 return
 
             if isinstance(entity_id, str):
                 if entity_filter(entity_id):
                     queue_put(event)
+                    if event.event_type == EVENT_STATE_CHANGED and self.enabled:
+                        recent_history_add(event)
                 return
 
             if isinstance(entity_id, list):
@@ -513,11 +550,12 @@ class Recorder(threading.Thread):
         Called after all migration steps are finished.
         """
         self._async_setup_periodic_tasks()
+        self._async_resume_purge()
         self.async_recorder_ready.set()
 
     @callback
     def async_nightly_tasks(self, now: datetime) -> None:
-        """Trigger the purge."""
+        """Trigger the purge and roll up statistics."""
         if self.auto_purge:
             # Purge will schedule the periodic cleanups
             # after it completes to ensure it does not happen
@@ -527,6 +565,46 @@ class Recorder(threading.Thread):
             self.queue_task(PurgeTask(purge_before, repack=repack, apply_filter=False))
         else:
             self.queue_task(PerodicCleanupTask())
+        if self.partitioned:
+            self.queue_task(CreatePartitionsTask())
+        self.queue_task(RollUpStatisticsTask())
+
+    async def async_load_purge_checkpoint(self) -> None:
+        """Load the checkpoint of a purge which did not finish."""
+        if data := await self._purge_checkpoint_store.async_load():
+            self.purge_progress = PurgeProgress.from_dict(data)
+            self._purge_checkpoint_saved = True
+
+    @callback
+    def _async_resume_purge(self) -> None:
+        """Resume a purge which did not finish before the last shutdown."""
+        if (progress := self.purge_progress) is None or progress.finished:
+            return
+        _LOGGER.debug(
+            "Resuming purge of states and events before %s", progress.purge_before
+        )
+        self.queue_task(
+            PurgeTask(
+                progress.purge_before,
+                repack=progress.repack,
+                apply_filter=progress.apply_filter,
+            )
+        )
+
+    @callback
+    def async_update_purge_checkpoint(self) -> None:
+        """Save or remove the purge checkpoint after a purge task ran."""
+        if (progress := self.purge_progress) is None or progress.finished:
+            if self._purge_checkpoint_saved:
+                self._purge_checkpoint_saved = False
+                self.hass.async_create_task(
+                    self._purge_checkpoint_store.async_remove(), eager_start=True
+                )
+            return
+        self._purge_checkpoint_saved = True
+        self._purge_checkpoint_store.async_delay_save(
+            progress.as_dict, PURGE_CHECKPOINT_SAVE_DELAY
+        )
 
     @callback
     def _async_five_minute_tasks(self, now: datetime) -> None:
@@ -1160,7 +1238,14 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if (
+            self.bulk_insert_states
+            and self.schema_version >= LAST_REPORTED_SCHEMA_VERSION
+        ):
+            self._event_session_has_pending_writes = True
+            states_manager.add_pending_insert(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1223,6 +1308,11 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        if self.states_manager.has_pending_inserts():
+            # Flush first so the StatesMeta and StateAttributes
+            # the pending states refer to have ids assigned
+            session.flush()
+            self.states_manager.insert_pending(session)
         session.commit()
 
         self._event_session_has_pending_writes = False
@@ -1424,10 +1514,34 @@ class Recorder(threading.Thread):
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         migration.pre_migrate_schema(self.engine)
+        if self.engine.dialect.name == SupportedDialect.POSTGRESQL:
+            self._setup_partitioned_tables()
+        elif self.db_partitioning:
+            _LOGGER.warning("Partitioned tables are only supported with PostgreSQL")
         Base.metadata.create_all(self.engine)
+        # The dialect only knows if the server supports RETURNING
+        # once it has connected and detected the server version
+        self.bulk_insert_states = (
+            self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_partitioned_tables(self) -> None:
+        """Create or detect the tables partitioned by day."""
+        assert self.engine is not None
+        if self.db_partitioning:
+            partition.create_partitioned_tables(self.engine)
+        with self.engine.begin() as connection:
+            self.partitioned = partition.has_partitioned_tables(connection)
+            if not self.partitioned:
+                if self.db_partitioning:
+                    _LOGGER.warning(
+                        "Partitioned tables can only be created in a new database"
+                    )
+                return
+            partition.create_partitions(connection, dt_util.utcnow())
+
     def _close_connection(self) -> None:
         """Close the connection."""
         if self.engine:
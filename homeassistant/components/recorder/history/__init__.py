@@ -7,15 +7,20 @@ from typing import Any
 
 from sqlalchemy.orm.session import Session
 
-from homeassistant.core import HomeAssistant, State
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.helpers.recorder import get_instance
 
 from ..filters import Filters
+from ..recent_history import RecentState
 from .const import NEED_ATTRIBUTE_DOMAINS, SIGNIFICANT_DOMAINS
 from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
+    get_recent_significant_states_json_fragments,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_json_fragments as _modern_get_significant_states_json_fragments,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
 )
@@ -24,9 +29,12 @@ from .modern import (
 __all__ = [
     "NEED_ATTRIBUTE_DOMAINS",
     "SIGNIFICANT_DOMAINS",
+    "async_get_recent_states",
     "get_full_significant_states_with_session",
     "get_last_state_changes",
+    "get_recent_significant_states_json_fragments",
     "get_significant_states",
+    "get_significant_states_json_fragments",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -115,6 +123,72 @@ def get_significant_states(
     )
 
 
+@callback
+def async_get_recent_states(
+    hass: HomeAssistant, entity_ids: list[str], start_time: datetime
+) -> dict[str, list[RecentState]] | None:
+    """Return the recent states of the entities if they cover start_time.
+
+    Returns None if the history has to be fetched from the database.
+    """
+    instance = get_instance(hass)
+    if not entity_ids or not instance.states_meta_manager.active:
+        return None
+    return instance.recent_history.async_get_states(entity_ids, start_time.timestamp())
+
+
+def get_significant_states_json_fragments(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> tuple[dict[str, json_fragment], float]:
+    """Return compressed states during a time period encoded as JSON per entity."""
+    if get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states_json_fragments(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
+
+    states = _legacy_get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+    )
+    last_time_ts = max(
+        (
+            state_list[-1][COMPRESSED_STATE_LAST_UPDATED]  # type: ignore[index]
+            for state_list in states.values()
+            if state_list
+        ),
+        default=0.0,
+    )
+    return {
+        entity_id: json_fragment(json_bytes(state_list))
+        for entity_id, state_list in states.items()
+    }, last_time_ts
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
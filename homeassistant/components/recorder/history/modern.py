@@ -6,7 +6,7 @@ from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
 from itertools import groupby
 from operator import itemgetter
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 
 from sqlalchemy import (
     CompoundSelect,
@@ -21,13 +21,16 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.helpers.recorder import get_instance
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
-from ..const import LAST_REPORTED_SCHEMA_VERSION
+from ..const import LAST_REPORTED_SCHEMA_VERSION, SupportedDialect
 from ..db_schema import SHARED_ATTR_OR_LEGACY_ATTRIBUTES, StateAttributes, States
 from ..filters import Filters
 from ..models import (
@@ -36,7 +39,9 @@ from ..models import (
     extract_metadata_ids,
     process_timestamp,
     row_to_compressed_state,
+    row_to_compressed_state_with_json_attributes,
 )
+from ..recent_history import RecentState
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
@@ -229,6 +234,237 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, start_time_ts = query
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def get_significant_states_json_fragments(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> tuple[dict[str, json_fragment], float]:
+    """Return compressed states changes during a period encoded as JSON per entity.
+
+    This is the streaming variant of get_significant_states with
+    compressed_state_format. Rows for windows longer than a day are
+    fetched in chunks and the states of each entity are encoded as
+    soon as they have been read, so memory use does not grow with
+    the number of rows returned.
+
+    Returns the encoded states and the last_updated timestamp
+    of the newest state, or 0 if there are no states.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return {}, 0.0
+        stmt, entity_id_to_metadata_id, start_time_ts = query
+        return _sorted_states_to_json_fragments(
+            execute_stmt_lambda_element(
+                session, stmt, start_time, end_time, orm_rows=False
+            ),
+            start_time_ts,
+            entity_ids,
+            entity_id_to_metadata_id,
+            minimal_response,
+            no_attributes,
+        )
+
+
+class _RecentStateRow(NamedTuple):
+    """A recent state in the shape of a significant states query row."""
+
+    metadata_id: int | None
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    attributes: bytes | None
+
+
+def get_recent_significant_states_json_fragments(
+    hass: HomeAssistant,
+    recent_states: dict[str, list[RecentState]],
+    start_time: datetime,
+    end_time: datetime | None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> tuple[dict[str, json_fragment], float]:
+    """Return compressed states from the recent history encoded as JSON per entity.
+
+    The recent states must cover the complete history of each entity since
+    start_time. The result is the same as get_significant_states_json_fragments
+    would return from the database.
+    """
+    dialect = get_instance(hass).dialect_name
+    start_time_ts = start_time.timestamp()
+    end_time_ts = datetime_to_timestamp_or_none(end_time)
+    return _grouped_states_to_json_fragments(
+        (
+            (
+                entity_id,
+                iter(
+                    cast(
+                        list[Row],
+                        _recent_states_to_rows(
+                            entity_id,
+                            states,
+                            start_time_ts,
+                            end_time_ts,
+                            include_start_time_state,
+                            significant_changes_only,
+                            no_attributes,
+                            dialect,
+                        ),
+                    )
+                ),
+            )
+            for entity_id, states in recent_states.items()
+        ),
+        start_time_ts if include_start_time_state else None,
+        list(recent_states),
+        minimal_response,
+        no_attributes,
+    )
+
+
+def _recent_states_to_rows(
+    entity_id: str,
+    recent_states: list[RecentState],
+    start_time_ts: float,
+    end_time_ts: float | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    dialect: SupportedDialect | None,
+) -> list[_RecentStateRow]:
+    """Convert the recent states of an entity to the rows the database would return."""
+    include_last_changed = not significant_changes_only
+    only_state_changes = (
+        significant_changes_only
+        and split_entity_id(entity_id)[0] not in SIGNIFICANT_DOMAINS
+    )
+    shared_attrs_cache: dict[int, bytes] = {}
+
+    def _shared_attrs(state: State | None) -> bytes | None:
+        """Return the attributes as they are stored in the database."""
+        if no_attributes or state is None:
+            return None
+        attributes_key = id(state.attributes)
+        if (shared_attrs := shared_attrs_cache.get(attributes_key)) is None:
+            shared_attrs = shared_attrs_cache[attributes_key] = (
+                StateAttributes.shared_attrs_bytes_from_state(state, dialect)
+            )
+        return shared_attrs
+
+    rows: list[_RecentStateRow] = []
+    start_state: RecentState | None = None
+    for recent_state in recent_states:
+        last_updated_ts, state = recent_state
+        if last_updated_ts < start_time_ts:
+            start_state = recent_state
+            continue
+        if end_time_ts and last_updated_ts >= end_time_ts:
+            break
+        if last_updated_ts == start_time_ts or (
+            only_state_changes
+            and state is not None
+            and state.last_changed != state.last_updated
+        ):
+            continue
+        try:
+            attributes = _shared_attrs(state)
+        except JSON_ENCODE_EXCEPTIONS:
+            # The recorder does not write states that cannot be serialized
+            continue
+        last_changed_ts: float | None = None
+        if (
+            include_last_changed
+            and state is not None
+            and state.last_changed != state.last_updated
+        ):
+            last_changed_ts = state.last_changed_timestamp
+        rows.append(
+            _RecentStateRow(
+                None,
+                state.state if state is not None else None,
+                last_updated_ts,
+                last_changed_ts,
+                attributes,
+            )
+        )
+
+    if include_start_time_state and start_state is not None:
+        state = start_state.state
+        try:
+            attributes = _shared_attrs(state)
+        except JSON_ENCODE_EXCEPTIONS:
+            return rows
+        # The state at the start time is reported as updated at the start time
+        rows.insert(
+            0,
+            _RecentStateRow(
+                None,
+                state.state if state is not None else None,
+                0,
+                0 if include_last_changed else None,
+                attributes,
+            ),
+        )
+    return rows
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, dict[str, int | None], float | None] | None:
+    """Return the statement to find significant states.
+
+    Returns None if none of the entities have been recorded.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -237,7 +473,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -275,14 +511,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
+        stmt,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
@@ -692,25 +924,107 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
-    field_map = _FIELD_MAP
-    state_class: Callable[
-        [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
-        State | dict[str, Any],
-    ]
-    if compressed_state_format:
-        state_class = row_to_compressed_state
-        attr_time = COMPRESSED_STATE_LAST_UPDATED
-        attr_state = COMPRESSED_STATE_STATE
-    else:
-        state_class = LazyState
-        attr_time = LAST_CHANGED_KEY
-        attr_state = STATE_KEY
-
     # Set all entity IDs to empty lists in result set to maintain the order
     result: dict[str, list[State | dict[str, Any]]] = {
         entity_id: [] for entity_id in entity_ids
     }
-    metadata_id_to_entity_id: dict[int, str] = {}
+    # The decoded attributes are shared by all the entities of the request
+    attr_cache: dict[str, dict[str, Any]] = {}
+    for entity_id, group in _group_states_by_entity_id(
+        states, entity_ids, entity_id_to_metadata_id
+    ):
+        _extend_entity_states(
+            result[entity_id],
+            group,
+            entity_id,
+            start_time_ts,
+            minimal_response,
+            row_to_compressed_state if compressed_state_format else LazyState,
+            attr_cache,
+            no_attributes,
+        )
+
+    if descending:
+        for ent_results in result.values():
+            ent_results.reverse()
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_json_fragments(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    no_attributes: bool,
+) -> tuple[dict[str, json_fragment], float]:
+    """Convert SQL results into compressed states encoded as JSON per entity.
+
+    The states of each entity are encoded as soon as all the rows for
+    the entity have been read so only the rows of a single entity are
+    held as python objects at any time.
+
+    Returns the encoded states and the last_updated timestamp of the
+    newest state.
+
+    States must be sorted by entity_id and last_updated
+    """
+    return _grouped_states_to_json_fragments(
+        _group_states_by_entity_id(states, entity_ids, entity_id_to_metadata_id),
+        start_time_ts,
+        entity_ids,
+        minimal_response,
+        no_attributes,
+    )
+
+
+def _grouped_states_to_json_fragments(
+    grouped_states: Iterable[tuple[str, Iterator[Row]]],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    minimal_response: bool,
+    no_attributes: bool,
+) -> tuple[dict[str, json_fragment], float]:
+    """Convert rows grouped by entity_id into compressed states encoded as JSON."""
+    result: dict[str, json_fragment] = {}
+    last_time_ts = 0.0
+    for entity_id, group in grouped_states:
+        ent_results: list[State | dict[str, Any]] = []
+        # The attributes are encoded as they are stored in the database
+        # without decoding them. The cache is not shared between entities
+        # so the rows of only one entity are referenced at a time.
+        _extend_entity_states(
+            ent_results,
+            group,
+            entity_id,
+            start_time_ts,
+            minimal_response,
+            row_to_compressed_state_with_json_attributes,
+            {},
+            no_attributes,
+        )
+        if not ent_results:
+            continue
+        last_time_ts = max(
+            last_time_ts,
+            cast(dict[str, Any], ent_results[-1])[COMPRESSED_STATE_LAST_UPDATED],
+        )
+        result[entity_id] = json_fragment(json_bytes(ent_results))
+
+    # Keep the order of the requested entity_ids
+    return {
+        entity_id: result[entity_id] for entity_id in entity_ids if entity_id in result
+    }, last_time_ts
+
+
+def _group_states_by_entity_id(
+    states: Iterable[Row],
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+) -> Iterator[tuple[str, Iterator[Row]]]:
+    """Group the sorted rows by entity_id."""
     metadata_id_to_entity_id = {
         v: k for k, v in entity_id_to_metadata_id.items() if v is not None
     }
@@ -718,101 +1032,110 @@ def _sorted_states_to_dict(
     if len(entity_ids) == 1:
         metadata_id = entity_id_to_metadata_id[entity_ids[0]]
         assert metadata_id is not None  # should not be possible if we got here
-        states_iter: Iterable[tuple[int, Iterator[Row]]] = (
-            (metadata_id, iter(states)),
-        )
+        yield entity_ids[0], iter(states)
+        return
+
+    for metadata_id, group in groupby(states, itemgetter(_FIELD_MAP["metadata_id"])):
+        yield metadata_id_to_entity_id[metadata_id], group
+
+
+def _extend_entity_states(
+    ent_results: list[State | dict[str, Any]],
+    group: Iterator[Row],
+    entity_id: str,
+    start_time_ts: float | None,
+    minimal_response: bool,
+    state_class: Callable[
+        [Row, Any, float | None, str, str, float | None, bool],
+        State | dict[str, Any],
+    ],
+    attr_cache: dict[str, Any],
+    no_attributes: bool,
+) -> None:
+    """Convert the rows of a single entity and append them to its results.
+
+    The state_class converts a row to a LazyState or a compressed state,
+    the attr_cache is passed to it to cache the attributes by their source.
+    """
+    field_map = _FIELD_MAP
+    compressed_state_format = state_class is not LazyState
+    if compressed_state_format:
+        attr_time = COMPRESSED_STATE_LAST_UPDATED
+        attr_state = COMPRESSED_STATE_STATE
     else:
-        key_func = itemgetter(field_map["metadata_id"])
-        states_iter = groupby(states, key_func)
+        attr_time = LAST_CHANGED_KEY
+        attr_state = STATE_KEY
 
     state_idx = field_map["state"]
     last_updated_ts_idx = field_map["last_updated_ts"]
-
-    # Append all changes to it
-    for metadata_id, group in states_iter:
-        entity_id = metadata_id_to_entity_id[metadata_id]
-        attr_cache: dict[str, dict[str, Any]] = {}
-        ent_results = result[entity_id]
-        if (
-            not minimal_response
-            or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
-        ):
-            ent_results.extend(
-                [
-                    state_class(
-                        db_state,
-                        attr_cache,
-                        start_time_ts,
-                        entity_id,
-                        db_state[state_idx],
-                        db_state[last_updated_ts_idx],
-                        False,
-                    )
-                    for db_state in group
-                ]
-            )
-            continue
-
-        prev_state: str | None = None
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            if (first_state := next(group, None)) is None:
-                continue
-            prev_state = first_state[state_idx]
-            ent_results.append(
+    if not minimal_response or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS:
+        ent_results.extend(
+            [
                 state_class(
-                    first_state,
+                    db_state,
                     attr_cache,
                     start_time_ts,
                     entity_id,
-                    prev_state,  # type: ignore[arg-type]
-                    first_state[last_updated_ts_idx],
-                    no_attributes,
+                    db_state[state_idx],
+                    db_state[last_updated_ts_idx],
+                    False,
                 )
-            )
+                for db_state in group
+            ]
+        )
+        return
 
-        #
-        # minimal_response only makes sense with last_updated == last_updated
-        #
-        # We use last_updated for for last_changed since its the same
-        #
-        # With minimal response we do not care about attribute
-        # changes so we can filter out duplicate states
-        if compressed_state_format:
-            # Compressed state format uses the timestamp directly
-            ent_results.extend(
-                [
-                    {
-                        attr_state: (prev_state := state),
-                        attr_time: row[last_updated_ts_idx],
-                    }
-                    for row in group
-                    if (state := row[state_idx]) != prev_state
-                ]
+    prev_state: str | None = None
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if not ent_results:
+        if (first_state := next(group, None)) is None:
+            return
+        prev_state = first_state[state_idx]
+        ent_results.append(
+            state_class(
+                first_state,
+                attr_cache,
+                start_time_ts,
+                entity_id,
+                prev_state,  # type: ignore[arg-type]
+                first_state[last_updated_ts_idx],
+                no_attributes,
             )
-            continue
+        )
 
-        # Non-compressed state format returns an ISO formatted string
-        _utc_from_timestamp = dt_util.utc_from_timestamp
+    #
+    # minimal_response only makes sense with last_updated == last_updated
+    #
+    # We use last_updated for for last_changed since its the same
+    #
+    # With minimal response we do not care about attribute
+    # changes so we can filter out duplicate states
+    if compressed_state_format:
+        # Compressed state format uses the timestamp directly
         ent_results.extend(
             [
                 {
                     attr_state: (prev_state := state),
-                    attr_time: _utc_from_timestamp(
-                        row[last_updated_ts_idx]
-                    ).isoformat(),
+                    attr_time: row[last_updated_ts_idx],
                 }
                 for row in group
                 if (state := row[state_idx]) != prev_state
             ]
         )
+        return
 
-    if descending:
-        for ent_results in result.values():
-            ent_results.reverse()
-
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+    # Non-compressed state format returns an ISO formatted string
+    _utc_from_timestamp = dt_util.utc_from_timestamp
+    ent_results.extend(
+        [
+            {
+                attr_state: (prev_state := state),
+                attr_time: _utc_from_timestamp(row[last_updated_ts_idx]).isoformat(),
+            }
+            for row in group
+            if (state := row[state_idx]) != prev_state
+        ]
+    )
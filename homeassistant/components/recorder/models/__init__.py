@@ -10,7 +10,12 @@ from .context import (
 )
 from .database import DatabaseEngine, DatabaseOptimizer, UnsupportedDialect
 from .event import extract_event_type_ids
-from .state import LazyState, extract_metadata_ids, row_to_compressed_state
+from .state import (
+    LazyState,
+    extract_metadata_ids,
+    row_to_compressed_state,
+    row_to_compressed_state_with_json_attributes,
+)
 from .statistics import (
     CalendarStatisticPeriod,
     FixedStatisticPeriod,
@@ -49,6 +54,7 @@ __all__ = [
     "process_timestamp",
     "process_timestamp_to_utc_isoformat",
     "row_to_compressed_state",
+    "row_to_compressed_state_with_json_attributes",
     "timestamp_to_datetime_or_none",
     "ulid_to_bytes_or_none",
     "uuid_hex_to_bytes_or_none",
@@ -16,9 +16,13 @@ from homeassistant.const import (
     COMPRESSED_STATE_STATE,
 )
 from homeassistant.core import Context, State
+from homeassistant.helpers.json import json_fragment
 import homeassistant.util.dt as dt_util
 
-from .state_attributes import decode_attributes_from_source
+from .state_attributes import (
+    attributes_json_fragment_from_source,
+    decode_attributes_from_source,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -132,6 +136,40 @@ def row_to_compressed_state(
         comp_state[COMPRESSED_STATE_ATTRIBUTES] = decode_attributes_from_source(
             getattr(row, "attributes", None), attr_cache
         )
+    _add_compressed_state_timestamps(comp_state, row, start_time_ts, last_updated_ts)
+    return comp_state
+
+
+def row_to_compressed_state_with_json_attributes(
+    row: Row,
+    attr_cache: dict[str | bytes, json_fragment],
+    start_time_ts: float | None,
+    entity_id: str,
+    state: str,
+    last_updated_ts: float | None,
+    no_attributes: bool,
+) -> dict[str, Any]:
+    """Convert a database row to a compressed state with undecoded attributes.
+
+    The attributes are kept as the JSON stored in the database so the
+    compressed state can only be used to encode it as JSON again.
+    """
+    comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: state}
+    if not no_attributes:
+        comp_state[COMPRESSED_STATE_ATTRIBUTES] = attributes_json_fragment_from_source(
+            getattr(row, "attributes", None), attr_cache
+        )
+    _add_compressed_state_timestamps(comp_state, row, start_time_ts, last_updated_ts)
+    return comp_state
+
+
+def _add_compressed_state_timestamps(
+    comp_state: dict[str, Any],
+    row: Row,
+    start_time_ts: float | None,
+    last_updated_ts: float | None,
+) -> None:
+    """Add the last updated and last changed timestamps to a compressed state."""
     row_last_updated_ts: float = last_updated_ts or start_time_ts  # type: ignore[assignment]
     comp_state[COMPRESSED_STATE_LAST_UPDATED] = row_last_updated_ts
     if (
@@ -140,4 +178,3 @@ def row_to_compressed_state(
         and row_last_updated_ts != row_last_changed_ts
     ):
         comp_state[COMPRESSED_STATE_LAST_CHANGED] = row_last_changed_ts
-    return comp_state
@@ -5,9 +5,11 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from homeassistant.helpers.json import json_fragment
 from homeassistant.util.json import json_loads_object
 
 EMPTY_JSON_OBJECT = "{}"
+EMPTY_JSON_FRAGMENT = json_fragment(EMPTY_JSON_OBJECT)
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -25,3 +27,18 @@ def decode_attributes_from_source(
         _LOGGER.exception("Error converting row to state attributes: %s", source)
         attr_cache[source] = attributes = {}
     return attributes
+
+
+def attributes_json_fragment_from_source(
+    source: Any, attr_cache: dict[str | bytes, json_fragment]
+) -> json_fragment:
+    """Return the attributes of a row source as JSON without decoding them.
+
+    The shared attributes are stored as JSON encoded by the recorder so
+    they can be embedded in a JSON response as they are.
+    """
+    if not source:
+        return EMPTY_JSON_FRAGMENT
+    if (fragment := attr_cache.get(source)) is None:
+        attr_cache[source] = fragment = json_fragment(source)
+    return fragment
@@ -0,0 +1,214 @@
+"""Time-partitioned tables for PostgreSQL.
+
+When enabled for a new PostgreSQL database the states, events and
+statistics_short_term tables are range partitioned by timestamp with
+one partition per UTC day. Purging a day is then done by dropping
+its partition instead of deleting its rows in batches.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import logging
+from typing import Final
+
+import sqlalchemy
+from sqlalchemy import Connection, Dialect, Engine, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.session import Session
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+import homeassistant.util.dt as dt_util
+
+from .db_schema import TABLE_EVENTS, TABLE_STATES, TABLE_STATISTICS_SHORT_TERM, Base
+
+_LOGGER = logging.getLogger(__name__)
+
+# The partitioned tables and the timestamp column they are partitioned by
+PARTITIONED_TABLES: Final = {
+    TABLE_STATES: "last_updated_ts",
+    TABLE_EVENTS: "time_fired_ts",
+    TABLE_STATISTICS_SHORT_TERM: "start_ts",
+}
+
+# The number of daily partitions created ahead of time
+PARTITION_DAYS_AHEAD = 7
+
+PARTITION_SUFFIX_FORMAT = "%Y%m%d"
+
+_FIND_PARTITIONED_TABLES = text(
+    "SELECT pg_class.relname FROM pg_partitioned_table"
+    " JOIN pg_class ON pg_partitioned_table.partrelid = pg_class.oid"
+)
+
+_FIND_PARTITIONS = text(
+    "SELECT child.relname FROM pg_inherits"
+    " JOIN pg_class parent ON pg_inherits.inhparent = parent.oid"
+    " JOIN pg_class child ON pg_inherits.inhrelid = child.oid"
+    " WHERE parent.relname = :table_name"
+)
+
+
+def partitioned_tables_ddl(dialect: Dialect) -> list[str]:
+    """Return the DDL to create the partitioned tables.
+
+    The partitioned tables differ from the tables created by
+    Base.metadata.create_all:
+
+    - The partition column is part of the primary key
+    - The primary key uses a sequence as PostgreSQL before 17 does
+      not support identity columns on partitioned tables
+    - There are no foreign keys referencing partitioned tables
+    - Rows outside of the daily partitions go to a default partition
+    """
+    ddl: list[str] = []
+    for table_name, column in PARTITIONED_TABLES.items():
+        table = Base.metadata.tables[table_name]
+        foreign_keys = [
+            foreign_key
+            for foreign_key in table.foreign_key_constraints
+            if foreign_key.referred_table.name not in PARTITIONED_TABLES
+        ]
+        (primary_key,) = table.primary_key.columns.keys()
+        create_table = str(
+            CreateTable(table, include_foreign_key_constraints=foreign_keys).compile(
+                dialect=dialect
+            )
+        )
+        create_table = create_table.replace(
+            "BIGINT GENERATED BY DEFAULT AS IDENTITY", "BIGSERIAL"
+        ).replace(
+            f"PRIMARY KEY ({primary_key})", f"PRIMARY KEY ({primary_key}, {column})"
+        )
+        ddl.append(f"{create_table.strip()} PARTITION BY RANGE ({column})")
+        ddl.extend(
+            str(CreateIndex(index).compile(dialect=dialect)) for index in table.indexes
+        )
+        ddl.append(
+            f"CREATE TABLE {table_name}_default PARTITION OF {table_name} DEFAULT"
+        )
+    return ddl
+
+
+def create_partitioned_tables(engine: Engine) -> bool:
+    """Create the partitioned tables in a new database.
+
+    Returns False if the database already has a states table since
+    existing tables are never converted.
+    """
+    if sqlalchemy.inspect(engine).has_table(TABLE_STATES):
+        return False
+    # The partitioned tables have foreign keys to the other tables
+    Base.metadata.create_all(
+        engine,
+        [
+            table
+            for table in Base.metadata.sorted_tables
+            if table.name not in PARTITIONED_TABLES
+        ],
+    )
+    with engine.begin() as connection:
+        for statement in partitioned_tables_ddl(engine.dialect):
+            connection.execute(text(statement))
+    _LOGGER.info("Created tables partitioned by day")
+    return True
+
+
+def has_partitioned_tables(connection: Connection | Session) -> bool:
+    """Return True if the states table is partitioned."""
+    return TABLE_STATES in {
+        table_name for (table_name,) in connection.execute(_FIND_PARTITIONED_TABLES)
+    }
+
+
+def partition_name(table_name: str, day: datetime) -> str:
+    """Return the name of the partition of a table for a day."""
+    return f"{table_name}_p{day.strftime(PARTITION_SUFFIX_FORMAT)}"
+
+
+def create_partitions(connection: Connection, now: datetime) -> None:
+    """Create the missing daily partitions from today until PARTITION_DAYS_AHEAD."""
+    today = now.astimezone(dt_util.UTC).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    for table_name in PARTITIONED_TABLES:
+        existing = _find_partitions(connection, table_name)
+        for days in range(PARTITION_DAYS_AHEAD + 1):
+            day = today + timedelta(days=days)
+            if (name := partition_name(table_name, day)) in existing:
+                continue
+            try:
+                with connection.begin_nested():
+                    connection.execute(
+                        text(
+                            f"CREATE TABLE {name} PARTITION OF {table_name}"
+                            f" FOR VALUES FROM ({day.timestamp()})"
+                            f" TO ({(day + timedelta(days=1)).timestamp()})"
+                        )
+                    )
+            except SQLAlchemyError:
+                # The default partition already has rows of this day
+                _LOGGER.warning(
+                    "Could not create partition %s, rows of this day are"
+                    " kept in %s_default",
+                    name,
+                    table_name,
+                    exc_info=True,
+                )
+
+
+def find_expired_partitions(
+    session: Session, table_name: str, purge_before: datetime
+) -> list[str]:
+    """Return the daily partitions of a table which end before purge_before."""
+    expired: list[str] = []
+    prefix = f"{table_name}_p"
+    for name in _find_partitions(session, table_name):
+        if not name.startswith(prefix):
+            continue
+        try:
+            day = datetime.strptime(
+                name.removeprefix(prefix), PARTITION_SUFFIX_FORMAT
+            ).replace(tzinfo=dt_util.UTC)
+        except ValueError:
+            continue
+        if day + timedelta(days=1) <= purge_before:
+            expired.append(name)
+    return sorted(expired)
+
+
+def select_distinct_ids(session: Session, name: str, column: str) -> set[int]:
+    """Return the distinct ids in a column of a partition."""
+    return {
+        row_id
+        for (row_id,) in session.execute(
+            text(
+                f"SELECT DISTINCT {column} FROM {name}"  # noqa: S608
+                f" WHERE {column} IS NOT NULL"
+            )
+        )
+    }
+
+
+def select_id_range(session: Session, name: str, column: str) -> tuple[int, int] | None:
+    """Return the lowest and highest id in a column of a partition."""
+    first_id, last_id = session.execute(
+        text(f"SELECT MIN({column}), MAX({column}) FROM {name}")  # noqa: S608
+    ).one()
+    if first_id is None:
+        return None
+    return first_id, last_id
+
+
+def drop_partition(session: Session, name: str) -> None:
+    """Drop a partition and all its rows."""
+    session.execute(text(f"DROP TABLE {name}"))
+    _LOGGER.debug("Dropped partition %s", name)
+
+
+def _find_partitions(connection: Connection | Session, table_name: str) -> set[str]:
+    """Return the names of the partitions of a table."""
+    return {
+        name
+        for (name,) in connection.execute(_FIND_PARTITIONS, {"table_name": table_name})
+    }
@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.util import dt as dt_util
 from homeassistant.util.collection import chunked_or_all
 
-from .db_schema import Events, States, StatesMeta
+from . import partition
+from .db_schema import TABLE_EVENTS, TABLE_STATES, Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
     attributes_ids_exist_in_states,
@@ -54,6 +57,65 @@ DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
 
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of a purge which may be spread over many purge tasks."""
+
+    purge_before: datetime
+    repack: bool
+    apply_filter: bool
+    states_purged: int = 0
+    events_purged: int = 0
+    # Seconds spent purging, excluding the time waiting in the queue
+    elapsed: float = 0.0
+    finished: bool = False
+
+    @property
+    def rows_purged(self) -> int:
+        """Return the number of states and events purged."""
+        return self.states_purged + self.events_purged
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the number of rows purged per second spent purging."""
+        if not self.elapsed:
+            return 0.0
+        return self.rows_purged / self.elapsed
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the progress."""
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "repack": self.repack,
+            "apply_filter": self.apply_filter,
+            "states_purged": self.states_purged,
+            "events_purged": self.events_purged,
+            "elapsed": self.elapsed,
+            "finished": self.finished,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PurgeProgress | None:
+        """Return progress from a dict representation."""
+        try:
+            return cls(
+                dt_util.parse_datetime(data["purge_before"], raise_on_error=True),
+                data["repack"],
+                data["apply_filter"],
+                data["states_purged"],
+                data["events_purged"],
+                data["elapsed"],
+                data["finished"],
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+def _deadline_passed(deadline: float | None) -> bool:
+    """Return True if the purge has used up its time budget."""
+    return deadline is not None and time.monotonic() > deadline
+
+
 @retryable_database_job("purge")
 def purge_old_data(
     instance: Recorder,
@@ -62,16 +124,28 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    deadline: float | None = None,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    If a deadline is passed, no new batch of states or events is
+    started once time.monotonic() passes it so the caller can commit
+    pending events before purging the next batches. The number of
+    purged rows is added to progress.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
     with session_scope(session=instance.get_session()) as session:
+        if instance.partitioned:
+            # Drop the partitions of whole days, the rows of the remaining
+            # part of the oldest day are deleted in batches below
+            _purge_expired_partitions(instance, session, purge_before)
+
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
         if instance.use_legacy_events_index and _purging_legacy_format(session):
@@ -87,10 +161,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, deadline, progress
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, deadline, progress
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -128,6 +202,33 @@ def purge_old_data(
     return True
 
 
+def _purge_expired_partitions(
+    instance: Recorder, session: Session, purge_before: datetime
+) -> None:
+    """Drop the partitions which only have rows older than purge_before."""
+    attributes_ids: set[int] = set()
+    data_ids: set[int] = set()
+    for table_name in partition.PARTITIONED_TABLES:
+        for name in partition.find_expired_partitions(
+            session, table_name, purge_before
+        ):
+            if table_name == TABLE_STATES:
+                # Remember the attributes and states which may no longer
+                # be referenced once the partition is dropped
+                attributes_ids |= partition.select_distinct_ids(
+                    session, name, "attributes_id"
+                )
+                if state_id_range := partition.select_id_range(
+                    session, name, "state_id"
+                ):
+                    instance.states_manager.evict_purged_state_id_range(*state_id_range)
+            elif table_name == TABLE_EVENTS:
+                data_ids |= partition.select_distinct_ids(session, name, "data_id")
+            partition.drop_partition(session, name)
+    _purge_unused_attributes_ids(instance, session, attributes_ids)
+    _purge_unused_data_ids(instance, session, data_ids)
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
@@ -178,6 +279,8 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    deadline: float | None = None,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -201,6 +304,10 @@ def _purge_states_and_attributes_ids(
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if progress is not None:
+            progress.states_purged += len(state_ids)
+        if _deadline_passed(deadline):
+            break
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -215,6 +322,8 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    deadline: float | None = None,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -236,6 +345,10 @@ def _purge_events_and_data_ids(
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if progress is not None:
+            progress.events_purged += len(event_ids)
+        if _deadline_passed(deadline):
+            break
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
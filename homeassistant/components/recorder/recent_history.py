@@ -0,0 +1,95 @@
+"""Keep the recently recorded states in memory."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import NamedTuple
+
+from homeassistant.core import Event, EventStateChangedData, State, callback
+
+
+class RecentState(NamedTuple):
+    """A state recorded by the recorder.
+
+    The state is None when the entity was removed.
+    """
+
+    last_updated_ts: float
+    state: State | None
+
+
+class RecentHistory:
+    """Bounded per entity buffer of recently recorded states.
+
+    The buffer is filled from the same state_changed events the
+    recorder writes to the database so recent history can be
+    answered without a database round-trip.
+
+    When more than max_states states are buffered, the oldest state is
+    dropped. The newest state of each entity is always kept, since it
+    is still the current state of the entity and is needed to find the
+    state at the start of a window.
+
+    This class is only accessed from the event loop.
+    """
+
+    def __init__(self, max_states: int) -> None:
+        """Initialize the recent history."""
+        self.max_states = max_states
+        self.hits = 0
+        self.misses = 0
+        self._entity_states: dict[str, deque[RecentState]] = {}
+        # The entity_id of each buffered state in the order they were added
+        self._added: deque[str] = deque()
+
+    @property
+    def states_count(self) -> int:
+        """Return the number of buffered states."""
+        return sum(len(states) for states in self._entity_states.values())
+
+    @callback
+    def async_add(self, event: Event[EventStateChangedData]) -> None:
+        """Add the new state of a state_changed event."""
+        if not self.max_states:
+            return
+        entity_id = event.data["entity_id"]
+        if (new_state := event.data["new_state"]) is None:
+            recent_state = RecentState(event.time_fired_timestamp, None)
+        else:
+            recent_state = RecentState(new_state.last_updated_timestamp, new_state)
+        if (states := self._entity_states.get(entity_id)) is None:
+            states = self._entity_states[entity_id] = deque()
+        states.append(recent_state)
+        self._added.append(entity_id)
+        if len(self._added) > self.max_states:
+            oldest_states = self._entity_states[self._added.popleft()]
+            if len(oldest_states) > 1:
+                oldest_states.popleft()
+
+    @callback
+    def async_get_states(
+        self, entity_ids: list[str], start_time_ts: float
+    ) -> dict[str, list[RecentState]] | None:
+        """Return a copy of the buffered states of the entities.
+
+        Returns None unless the complete history of every entity
+        since start_time_ts is buffered.
+        """
+        entity_states = self._entity_states
+        result: dict[str, list[RecentState]] = {}
+        for entity_id in entity_ids:
+            if (
+                not (states := entity_states.get(entity_id))
+                or states[0].last_updated_ts >= start_time_ts
+            ):
+                self.misses += 1
+                return None
+            result[entity_id] = list(states)
+        self.hits += 1
+        return result
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop all buffered states."""
+        self._entity_states.clear()
+        self._added.clear()
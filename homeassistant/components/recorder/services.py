@@ -97,6 +97,7 @@ def _async_register_purge_entities_service(
         entity_filter = generate_filter(domains, list(entity_ids), [], [], entity_globs)
         purge_before = dt_util.utcnow() - timedelta(days=keep_days)
         instance.queue_task(PurgeEntitiesTask(entity_filter, purge_before))
+        instance.recent_history.async_clear()
 
     async_register_admin_service(
         hass,
@@ -11,7 +11,7 @@ from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
-from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypedDict, cast
 
 from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
 from sqlalchemy.engine.row import Row
@@ -60,8 +60,11 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
+    StatisticsWeekly,
 )
 from .models import (
     StatisticData,
@@ -156,6 +159,35 @@ UNIT_CLASSES = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_HOURLY_STATISTICS_ACCUMULATOR = "recorder_hourly_statistics_accumulator"
+
+SHORT_TERM_PERIODS_PER_HOUR = int(Statistics.duration / StatisticsShortTerm.duration)
+
+# Limit the number of hourly statistics rolled up by one task to keep
+# the recorder responsive while the rollups of a large database are built
+MAX_ROLLUP_HOURLY_STATISTICS = 100000
+
+ALL_STATISTIC_TYPES: set[
+    Literal["last_reset", "max", "mean", "min", "state", "sum"]
+] = {
+    "last_reset",
+    "max",
+    "mean",
+    "min",
+    "state",
+    "sum",
+}
+
+# metadata_id, mean, min, max, last_reset_ts, state, sum
+type ShortTermStatisticSummaryRow = tuple[
+    int,
+    float | None,
+    float | None,
+    float | None,
+    float | None,
+    float | None,
+    float | None,
+]
 
 
 def mean(values: list[float]) -> float | None:
@@ -199,6 +231,92 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+@dataclasses.dataclass(slots=True)
+class HourlyStatisticsAccumulator:
+    """Accumulator for the 5-minute statistics of the hour being compiled.
+
+    The 5-minute statistics are collected as they are compiled so the
+    hourly statistics can be summarized without querying the short term
+    statistics table again at the end of the hour.
+
+    This class is not thread-safe and must only be used from the
+    recorder thread.
+    """
+
+    # Start of the hour the statistics are accumulated for
+    start_ts: float | None = None
+    # This is a mapping of the start of each 5-minute period to the
+    # (metadata_id, mean, min, max, last_reset_ts, state, sum) of the
+    # statistics compiled for the period
+    _periods: dict[float, list[ShortTermStatisticSummaryRow]] = dataclasses.field(
+        default_factory=dict
+    )
+
+    def reset(self, start_ts: float | None = None) -> None:
+        """Start accumulating the hour starting at start_ts."""
+        self.start_ts = start_ts
+        self._periods.clear()
+
+    def add_period(
+        self,
+        period_start_ts: float,
+        stats: Iterable[ShortTermStatisticSummaryRow],
+    ) -> None:
+        """Add the statistics compiled for a 5-minute period.
+
+        Adding a period again replaces the statistics added before.
+        """
+        self._periods[period_start_ts] = list(stats)
+
+    @property
+    def complete(self) -> bool:
+        """Return if every 5-minute period of the hour has been added."""
+        return len(self._periods) == SHORT_TERM_PERIODS_PER_HOUR
+
+    def summarize(self) -> dict[int, StatisticDataTimestamp]:
+        """Summarize the accumulated statistics.
+
+        The result is the same as _compile_hourly_statistics computes in
+        the database: the average of the means, the lowest min and the
+        highest max, with the state and sum of the last 5-minute period.
+        """
+        means: defaultdict[int, list[float]] = defaultdict(list)
+        summary: dict[int, dict[str, Any]] = {}
+        for period_start_ts in sorted(self._periods):
+            for (
+                metadata_id,
+                _mean,
+                _min,
+                _max,
+                last_reset_ts,
+                state,
+                _sum,
+            ) in self._periods[period_start_ts]:
+                if (summary_item := summary.get(metadata_id)) is None:
+                    summary_item = summary[metadata_id] = {
+                        "start_ts": self.start_ts,
+                        "mean": None,
+                        "min": None,
+                        "max": None,
+                    }
+                if _mean is not None:
+                    means[metadata_id].append(_mean)
+                if _min is not None and (
+                    summary_item["min"] is None or _min < summary_item["min"]
+                ):
+                    summary_item["min"] = _min
+                if _max is not None and (
+                    summary_item["max"] is None or _max > summary_item["max"]
+                ):
+                    summary_item["max"] = _max
+                summary_item["last_reset_ts"] = last_reset_ts
+                summary_item["state"] = state
+                summary_item["sum"] = _sum
+        for metadata_id, values in means.items():
+            summary[metadata_id]["mean"] = mean(values)
+        return cast(dict[int, StatisticDataTimestamp], summary)
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -388,11 +506,75 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compiled_short_term_runs_stmt(
+    start_time: datetime, end_time: datetime
+) -> StatementLambdaElement:
+    """Generate the statement to find the compiled 5-minute periods."""
+    return lambda_stmt(
+        lambda: select(StatisticsRuns.start)
+        .filter(StatisticsRuns.start >= start_time)
+        .filter(StatisticsRuns.start < end_time)
+    )
+
+
+def _short_term_statistics_summary_rows_stmt(
+    start_time_ts: float, end_time_ts: float
+) -> StatementLambdaElement:
+    """Generate the statement to find the 5-minute statistics to summarize."""
+    return lambda_stmt(
+        lambda: select(
+            StatisticsShortTerm.start_ts,
+            StatisticsShortTerm.metadata_id,
+            StatisticsShortTerm.mean,
+            StatisticsShortTerm.min,
+            StatisticsShortTerm.max,
+            StatisticsShortTerm.last_reset_ts,
+            StatisticsShortTerm.state,
+            StatisticsShortTerm.sum,
+        )
+        .filter(StatisticsShortTerm.start_ts >= start_time_ts)
+        .filter(StatisticsShortTerm.start_ts < end_time_ts)
+    )
+
+
+def _load_hourly_statistics_accumulator(
+    session: Session, accumulator: HourlyStatisticsAccumulator, start: datetime
+) -> None:
+    """Load the 5-minute statistics compiled earlier in the hour of start.
+
+    This restores the accumulator after a restart or after statistics
+    were changed outside of the 5-minute compile.
+    """
+    start_time = start.replace(minute=0)
+    accumulator.reset(start_time.timestamp())
+    if start_time == start:
+        return
+    stats_by_period: dict[float, list[ShortTermStatisticSummaryRow]] = {
+        process_timestamp(run.start).timestamp(): []
+        for run in execute_stmt_lambda_element(
+            session, _compiled_short_term_runs_stmt(start_time, start)
+        )
+    }
+    for row in execute_stmt_lambda_element(
+        session,
+        _short_term_statistics_summary_rows_stmt(
+            start_time.timestamp(), start.timestamp()
+        ),
+    ):
+        if (period_stats := stats_by_period.get(row[0])) is not None:
+            period_stats.append(tuple(row[1:]))
+    for period_start_ts, period_stats in stats_by_period.items():
+        accumulator.add_period(period_start_ts, period_stats)
+
+
+def _compile_hourly_statistics(
+    session: Session, start: datetime, accumulator: HourlyStatisticsAccumulator
+) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
-    - average, min max is computed by a database query
+    - average, min max is computed from the accumulated 5-minute
+      statistics, or by a database query if some are missing
     - sum is taken from the last 5-minute entry during the hour
     """
     start_time = start.replace(minute=0)
@@ -400,6 +582,25 @@ def _compile_hourly_statistics(session: Session, start: datetime) -> None:
     end_time = start_time + Statistics.duration
     end_time_ts = end_time.timestamp()
 
+    # The accumulator may hold periods which were rolled back, so only
+    # use it if all the earlier periods of the hour were committed.
+    if (
+        accumulator.start_ts == start_time_ts
+        and accumulator.complete
+        and len(
+            execute_stmt_lambda_element(
+                session, _compiled_short_term_runs_stmt(start_time, start)
+            )
+        )
+        == SHORT_TERM_PERIODS_PER_HOUR - 1
+    ):
+        session.add_all(
+            Statistics.from_stats_ts(metadata_id, summary_item)
+            for metadata_id, summary_item in accumulator.summarize().items()
+        )
+        return
+
+    _LOGGER.debug("Compiling hourly statistics for %s from the database", start_time)
     # Compute last hour's average, min, max
     summary: dict[int, StatisticDataTimestamp] = {}
     stmt = _compile_hourly_statistics_summary_mean_stmt(start_time_ts, end_time_ts)
@@ -545,6 +746,10 @@ def _compile_statistics(
         _LOGGER.debug("Statistics already compiled for %s-%s", start, end)
         return modified_statistic_ids
 
+    accumulator = get_hourly_statistics_accumulator(instance.hass)
+    if accumulator.start_ts != start.replace(minute=0).timestamp():
+        _load_hourly_statistics_accumulator(session, accumulator, start)
+
     _LOGGER.debug("Compiling statistics for %s-%s", start, end)
     platform_stats: list[StatisticResult] = []
     current_metadata: dict[str, tuple[int, StatisticMetaData]] = {}
@@ -598,9 +803,25 @@ def _compile_statistics(
                 continue
             platform_update_issues(instance.hass, session)
 
+    accumulator.add_period(
+        start.timestamp(),
+        (
+            (
+                cast(int, new_stat.metadata_id),
+                new_stat.mean,
+                new_stat.min,
+                new_stat.max,
+                new_stat.last_reset_ts,
+                new_stat.state,
+                new_stat.sum,
+            )
+            for new_stat in new_short_term_stats
+        ),
+    )
+
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        _compile_hourly_statistics(session, start, accumulator)
 
     session.add(StatisticsRuns(start=start))
 
@@ -747,6 +968,7 @@ def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
+    get_hourly_statistics_accumulator(instance.hass).reset()
 
 
 def update_statistics_metadata(
@@ -997,17 +1219,6 @@ def reduce_day_ts_factory() -> (
     return _same_day_ts, _day_start_end_ts_cached
 
 
-def _reduce_statistics_per_day(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to daily statistics."""
-    _same_day_ts, _day_start_end_ts = reduce_day_ts_factory()
-    return _reduce_statistics(
-        stats, _same_day_ts, _day_start_end_ts, timedelta(days=1), types
-    )
-
-
 def reduce_week_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
@@ -1047,17 +1258,6 @@ def reduce_week_ts_factory() -> (
     return _same_week_ts, _week_start_end_ts_cached
 
 
-def _reduce_statistics_per_week(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to weekly statistics."""
-    _same_week_ts, _week_start_end_ts = reduce_week_ts_factory()
-    return _reduce_statistics(
-        stats, _same_week_ts, _week_start_end_ts, timedelta(days=7), types
-    )
-
-
 def _find_month_end_time(timestamp: datetime) -> datetime:
     """Return the end of the month (midnight at the first day of the next month)."""
     # We add 4 days to the end to make sure we are in the next month
@@ -1102,17 +1302,168 @@ def reduce_month_ts_factory() -> (
     return _same_month_ts, _month_start_end_ts_cached
 
 
-def _reduce_statistics_per_month(
-    stats: dict[str, list[StatisticsRow]],
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Reduce hourly statistics to monthly statistics."""
-    _same_month_ts, _month_start_end_ts = reduce_month_ts_factory()
-    return _reduce_statistics(
-        stats, _same_month_ts, _month_start_end_ts, timedelta(days=31), types
+class StatisticsRollup(NamedTuple):
+    """A table with hourly statistics rolled up to a longer period."""
+
+    table: type[StatisticsBase]
+    period_factory: Callable[
+        [],
+        tuple[
+            Callable[[float, float], bool],
+            Callable[[float], tuple[float, float]],
+        ],
+    ]
+
+    def reduce(
+        self,
+        stats: dict[str, list[StatisticsRow]],
+        types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+    ) -> dict[str, list[StatisticsRow]]:
+        """Reduce hourly statistics to the period of the rollup."""
+        return _reduce_statistics(
+            stats, *self.period_factory(), self.table.duration, types
+        )
+
+
+STATISTICS_ROLLUPS: dict[str, StatisticsRollup] = {
+    "day": StatisticsRollup(StatisticsDaily, reduce_day_ts_factory),
+    "week": StatisticsRollup(StatisticsWeekly, reduce_week_ts_factory),
+    "month": StatisticsRollup(StatisticsMonthly, reduce_month_ts_factory),
+}
+
+
+def _latest_statistics_rollup_start_stmt(
+    table: type[StatisticsBase], metadata_id: int
+) -> StatementLambdaElement:
+    """Generate a statement to find the start of the latest rollup of a statistic."""
+    return lambda_stmt(
+        lambda: select(table.start_ts)
+        .filter(table.metadata_id == metadata_id)
+        .order_by(table.start_ts.desc())
+        .limit(1)
     )
 
 
+def _roll_up_statistics(
+    hass: HomeAssistant,
+    session: Session,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    rollup: StatisticsRollup,
+    metadata_id: int,
+    end_time_ts: float,
+) -> int:
+    """Roll up the hourly statistics of a statistic which start before end_time_ts.
+
+    Only the periods after the latest rollup of the statistic are rolled up.
+    Returns the number of hourly statistics which were rolled up.
+    """
+    table = rollup.table
+    _, period_start_end = rollup.period_factory()
+    start_time_ts = 0.0
+    if latest := execute_stmt_lambda_element(
+        session, _latest_statistics_rollup_start_stmt(table, metadata_id)
+    ):
+        latest_start_ts: float = latest[0].start_ts
+        latest_start_ts_in_time_zone, latest_end_ts = period_start_end(latest_start_ts)
+        if latest_start_ts_in_time_zone == latest_start_ts:
+            start_time_ts = latest_end_ts
+        else:
+            # The time zone has changed since the statistic was rolled up,
+            # roll up all hourly statistics again
+            session.query(table).filter(table.metadata_id == metadata_id).delete(
+                synchronize_session=False
+            )
+    if start_time_ts >= end_time_ts:
+        return 0
+
+    stmt = _generate_statistics_during_period_stmt(
+        dt_util.utc_from_timestamp(start_time_ts),
+        dt_util.utc_from_timestamp(end_time_ts),
+        [metadata_id],
+        Statistics,
+        ALL_STATISTIC_TYPES,
+    )
+    stats = cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    )
+    if not stats:
+        return 0
+
+    hourly_stats = _sorted_statistics_to_dict(
+        hass, stats, None, metadata, False, Statistics, None, ALL_STATISTIC_TYPES
+    )
+    for rows in rollup.reduce(hourly_stats, ALL_STATISTIC_TYPES).values():
+        session.add_all(
+            table.from_stats_ts(
+                metadata_id,
+                {
+                    "start_ts": row["start"],
+                    "mean": row["mean"],
+                    "min": row["min"],
+                    "max": row["max"],
+                    "last_reset_ts": row["last_reset"],
+                    "state": row["state"],
+                    "sum": row["sum"],
+                },
+            )
+            for row in rows
+        )
+    return len(stats)
+
+
+@retryable_database_job("roll up statistics")
+def roll_up_statistics(instance: Recorder) -> bool:
+    """Roll up hourly statistics of completed days, weeks and months.
+
+    Returns False if there are more statistics to roll up.
+    """
+    with session_scope(
+        session=instance.get_session(),
+        exception_filter=filter_unique_constraint_integrity_error(
+            instance, "statistic"
+        ),
+    ) as session:
+        if not (last_run := session.query(func.max(StatisticsRuns.start)).scalar()):
+            return True
+        # Hourly statistics have been compiled up to the end of the last full
+        # hour of 5-minute statistics
+        compiled_until_ts = (
+            (process_timestamp(last_run) + StatisticsShortTerm.duration)
+            .replace(minute=0, second=0, microsecond=0)
+            .timestamp()
+        )
+        metadata = instance.statistics_meta_manager.get_many(session)
+        rolled_up = 0
+        for rollup in STATISTICS_ROLLUPS.values():
+            _, period_start_end = rollup.period_factory()
+            # Only completed periods are rolled up
+            end_time_ts, _ = period_start_end(compiled_until_ts)
+            for metadata_id, _ in metadata.values():
+                rolled_up += _roll_up_statistics(
+                    instance.hass, session, metadata, rollup, metadata_id, end_time_ts
+                )
+                if rolled_up >= MAX_ROLLUP_HOURLY_STATISTICS:
+                    return False
+
+    return True
+
+
+def _delete_statistics_rollups(
+    session: Session, metadata_id: int, start_time: datetime
+) -> None:
+    """Delete the rollups of a statistic which include hourly statistics from start_time.
+
+    The deleted periods are rolled up again by the next roll_up_statistics job.
+    """
+    start_time_ts = start_time.timestamp()
+    for table, period_factory in STATISTICS_ROLLUPS.values():
+        _, period_start_end = period_factory()
+        period_start_ts, _ = period_start_end(start_time_ts)
+        session.query(table).filter(
+            table.metadata_id == metadata_id, table.start_ts >= period_start_ts
+        ).delete(synchronize_session=False)
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1698,6 +2049,88 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _reduced_statistics_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    metadata_ids: list[int] | None,
+    rollup: StatisticsRollup,
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return daily, weekly or monthly statistics during a period.
+
+    Periods which have been rolled up are read from the rollup table, the
+    periods after the latest rollup of each statistic are reduced from
+    hourly statistics.
+    """
+    result: dict[str, list[StatisticsRow]] = {}
+    _, period_start_end = rollup.period_factory()
+    stmt = _generate_statistics_during_period_stmt(
+        start_time, end_time, metadata_ids, rollup.table, types
+    )
+    if stats := cast(
+        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+    ):
+        result = _sorted_statistics_to_dict(
+            hass, stats, statistic_ids, metadata, True, rollup.table, units, types
+        )
+        if any(
+            period_start_end(row["start"])[0] != row["start"]
+            for rows in result.values()
+            for row in rows
+        ):
+            # The time zone has changed since the statistics were rolled up,
+            # reduce all periods from hourly statistics
+            result = {}
+        for rows in result.values():
+            for row in rows:
+                row["end"] = period_start_end(row["start"])[1]
+
+    # Statistics rolled up to the same period are reduced from hourly
+    # statistics with a single query
+    start_time_ts = start_time.timestamp()
+    hourly_start_times: dict[float, list[int]] = defaultdict(list)
+    for statistic_id, (metadata_id, _) in metadata.items():
+        if rows := result.get(statistic_id):
+            hourly_start_times[rows[-1]["end"]].append(metadata_id)
+        else:
+            hourly_start_times[start_time_ts].append(metadata_id)
+
+    end_time_ts = end_time.timestamp() if end_time is not None else None
+    for hourly_start_ts, hourly_metadata_ids in hourly_start_times.items():
+        if end_time_ts is not None and hourly_start_ts >= end_time_ts:
+            continue
+        stmt = _generate_statistics_during_period_stmt(
+            dt_util.utc_from_timestamp(hourly_start_ts),
+            end_time,
+            # Avoid listing every statistic when all statistics were requested
+            # and none of them have been rolled up
+            hourly_metadata_ids
+            if metadata_ids is not None or len(hourly_start_times) > 1
+            else None,
+            Statistics,
+            types,
+        )
+        if not (
+            stats := cast(
+                Sequence[Row],
+                execute_stmt_lambda_element(session, stmt, orm_rows=False),
+            )
+        ):
+            continue
+        hourly_stats = _sorted_statistics_to_dict(
+            hass, stats, statistic_ids, metadata, True, Statistics, units, types
+        )
+        for statistic_id, rows in rollup.reduce(hourly_stats, types).items():
+            result.setdefault(statistic_id, []).extend(rows)
+
+    return result
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1768,35 +2201,42 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
-
-    if not stats:
-        return {}
-
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
-
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+    if rollup := STATISTICS_ROLLUPS.get(period):
+        result = _reduced_statistics_during_period(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            metadata,
+            metadata_ids,
+            rollup,
+            units,
+            types,
+        )
+        if not result:
+            return {}
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if not stats:
+            return {}
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2340,15 +2780,24 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    first_start: datetime | None = None
     for stat in statistics:
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
+        if first_start is None or stat["start"] < first_start:
+            first_start = stat["start"]
+
+    if table == Statistics and first_start is not None:
+        # The rollups which include the imported statistics are out of date
+        _delete_statistics_rollups(session, metadata_id, first_start)
 
     if table != StatisticsShortTerm:
         return True
 
+    # The imported statistics may be in the hour being accumulated
+    get_hourly_statistics_accumulator(instance.hass).reset()
     # We just inserted new short term statistics, so we need to update the
     # ShortTermStatisticsRunCache with the latest id for the metadata_id
     run_cache = get_short_term_statistics_run_cache(instance.hass)
@@ -2367,6 +2816,14 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_HOURLY_STATISTICS_ACCUMULATOR)
+def get_hourly_statistics_accumulator(
+    hass: HomeAssistant,
+) -> HourlyStatisticsAccumulator:
+    """Get the hourly statistics accumulator."""
+    return HourlyStatisticsAccumulator()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2476,6 +2933,11 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        _delete_statistics_rollups(
+            session, metadata[statistic_id][0], start_time.replace(minute=0)
+        )
+
+    get_hourly_statistics_accumulator(instance.hass).reset()
     return True
 
 
@@ -2536,6 +2998,9 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDaily,
+            StatisticsWeekly,
+            StatisticsMonthly,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
@@ -2544,6 +3009,8 @@ def change_statistics_unit(
             session, statistic_id, new_unit
         )
 
+    get_hourly_statistics_accumulator(instance.hass).reset()
+
 
 @callback
 def async_change_statistics_unit(
@@ -55,6 +55,24 @@ def _async_get_db_engine_info(instance: Recorder) -> dict[str, Any]:
     return db_engine_info
 
 
+@callback
+def _async_get_recent_history_info(instance: Recorder) -> dict[str, Any]:
+    """Get recent history info."""
+    recent_history = instance.recent_history
+    if not recent_history.max_states:
+        return {}
+    recent_history_info: dict[str, Any] = {
+        "recent_history_states": (
+            f"{recent_history.states_count}/{recent_history.max_states}"
+        )
+    }
+    if requests := recent_history.hits + recent_history.misses:
+        recent_history_info["recent_history_hit_ratio"] = (
+            f"{recent_history.hits / requests:.1%}"
+        )
+    return recent_history_info
+
+
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     instance = get_instance(hass)
@@ -62,6 +80,7 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     recorder_runs_manager = instance.recorder_runs_manager
     database_name = urlparse(instance.db_url).path.lstrip("/")
     db_engine_info = _async_get_db_engine_info(instance)
+    recent_history_info = _async_get_recent_history_info(instance)
     db_stats: dict[str, Any] = {}
 
     if instance.async_db_ready.done():
@@ -72,4 +91,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | recent_history_info
@@ -2,8 +2,19 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+from sqlalchemy import insert, inspect
+from sqlalchemy.orm.session import Session, SessionTransaction
+
 from ..db_schema import States
 
+# Statement used to bulk insert states and get back the
+# assigned state_ids in the order the rows were passed in
+_INSERT_STATES_RETURNING_IDS = insert(States).returning(
+    States.state_id, sort_by_parameter_order=True
+)
+
 
 class StatesManager:
     """Manage the states table."""
@@ -13,6 +24,9 @@ class StatesManager:
         self._pending: dict[str, States] = {}
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
+        self._pending_inserts: list[States] = []
+        self._inserted: set[int] = set()
+        self._insert_transaction: SessionTransaction | None = None
 
     def pop_pending(self, entity_id: str) -> States | None:
         """Pop a pending state.
@@ -45,6 +59,92 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_insert(self, state: States) -> None:
+        """Add a state that will be bulk inserted at the next commit.
+
+        The state is not added to the session which avoids the
+        unit-of-work overhead of the ORM for every state row.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_inserts.append(state)
+
+    def has_pending_inserts(self) -> bool:
+        """Return if there are states waiting to be bulk inserted."""
+        return bool(self._pending_inserts)
+
+    def insert_pending(self, session: Session) -> None:
+        """Bulk insert the pending states.
+
+        The session must be flushed before calling this so the
+        StatesMeta and StateAttributes rows the states refer to
+        have been assigned ids.
+
+        States that replace another pending state in the same
+        batch need the state_id of the state they replace, so the
+        rows are inserted in generations where each generation only
+        refers to rows inserted by a previous generation. In the
+        common case every entity changes at most once per commit
+        interval and all the rows are written with a single
+        executemany.
+
+        The pending states are kept until post_commit_pending so
+        the insert can be retried if the commit fails. States that
+        were already inserted in the still open transaction are
+        not inserted again.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        transaction = session.get_transaction()
+        if transaction is not self._insert_transaction:
+            # The transaction the states were inserted in
+            # was rolled back, so they all have to be inserted
+            self._insert_transaction = transaction
+            self._inserted.clear()
+
+        inserted = self._inserted
+        generations: list[list[States]] = []
+        generation_by_state: dict[int, int] = {}
+
+        def _add_to_generation(db_state: States) -> int:
+            """Add a state and the pending states it replaces to a generation."""
+            if (generation := generation_by_state.get(id(db_state))) is not None:
+                return generation
+            generation = 0
+            if (old_state := db_state.old_state) is not None and (
+                id(old_state) in generation_by_state or inspect(old_state).transient
+            ):
+                # The old state may not be in the pending inserts if it
+                # was never recorded because its attributes could not be
+                # serialized. It still has to be inserted so the old_state_id
+                # chain is not broken, the same as the ORM cascade would do.
+                generation = _add_to_generation(old_state) + 1
+            generation_by_state[id(db_state)] = generation
+            if generation == len(generations):
+                generations.append([])
+            generations[generation].append(db_state)
+            return generation
+
+        for db_state in self._pending_inserts:
+            _add_to_generation(db_state)
+
+        for db_states in generations:
+            if not (
+                to_insert := [
+                    db_state for db_state in db_states if id(db_state) not in inserted
+                ]
+            ):
+                continue
+            result = session.execute(
+                _INSERT_STATES_RETURNING_IDS,
+                [_state_to_insert_row(db_state) for db_state in to_insert],
+            )
+            for db_state, (state_id,) in zip(to_insert, result, strict=True):
+                db_state.state_id = state_id
+                inserted.add(id(db_state))
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -65,6 +165,7 @@ class StatesManager:
             self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
         self._last_reported.clear()
+        self._clear_pending_inserts()
 
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
@@ -74,6 +175,13 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._clear_pending_inserts()
+
+    def _clear_pending_inserts(self) -> None:
+        """Clear the states waiting to be bulk inserted."""
+        self._pending_inserts.clear()
+        self._inserted.clear()
+        self._insert_transaction = None
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -93,6 +201,18 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+    def evict_purged_state_id_range(
+        self, first_state_id: int, last_state_id: int
+    ) -> None:
+        """Evict the committed states in a range of purged state ids.
+
+        Used when a whole partition of states is dropped at once.
+        """
+        last_committed_ids = self._last_committed_id
+        for entity_id, state_id in list(last_committed_ids.items()):
+            if first_state_id <= state_id <= last_state_id:
+                del last_committed_ids[entity_id]
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
@@ -102,3 +222,38 @@ class StatesManager:
         last_committed_ids = self._last_committed_id
         for entity_id in purged_entity_ids:
             last_committed_ids.pop(entity_id, None)
+
+
+def _state_to_insert_row(db_state: States) -> dict[str, Any]:
+    """Convert a pending States object to a row for a bulk insert.
+
+    The old_state_id, attributes_id and metadata_id are resolved
+    from the relationships when the related row was added in the
+    same commit.
+    """
+    old_state_id = db_state.old_state_id
+    if old_state_id is None and (old_state := db_state.old_state) is not None:
+        old_state_id = old_state.state_id
+    attributes_id = db_state.attributes_id
+    if (
+        attributes_id is None
+        and (state_attributes := db_state.state_attributes) is not None
+    ):
+        attributes_id = state_attributes.attributes_id
+    metadata_id = db_state.metadata_id
+    if metadata_id is None and (states_meta := db_state.states_meta_rel) is not None:
+        metadata_id = states_meta.metadata_id
+    return {
+        "entity_id": db_state.entity_id,
+        "state": db_state.state,
+        "last_changed_ts": db_state.last_changed_ts,
+        "last_reported_ts": db_state.last_reported_ts,
+        "last_updated_ts": db_state.last_updated_ts,
+        "old_state_id": old_state_id,
+        "attributes_id": attributes_id,
+        "metadata_id": metadata_id,
+        "context_id_bin": db_state.context_id_bin,
+        "context_user_id_bin": db_state.context_user_id_bin,
+        "context_parent_id_bin": db_state.context_parent_id_bin,
+        "origin_idx": db_state.origin_idx,
+    }
@@ -9,13 +9,15 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 import threading
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.helpers.typing import UndefinedType
+import homeassistant.util.dt as dt_util
 from homeassistant.util.event_type import EventType
 
-from . import entity_registry, purge, statistics
-from .const import DOMAIN
+from . import entity_registry, partition, purge, statistics
+from .const import DOMAIN, PURGE_TIME_BUDGET
 from .db_schema import Statistics, StatisticsShortTerm
 from .models import StatisticData, StatisticMetaData
 from .util import periodic_db_cleanups, session_scope
@@ -117,9 +119,29 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
+        progress = instance.purge_progress
+        if (
+            progress is None
+            or progress.finished
+            or progress.purge_before != self.purge_before
         ):
+            progress = purge.PurgeProgress(
+                self.purge_before, self.repack, self.apply_filter
+            )
+            instance.purge_progress = progress
+        start = time.monotonic()
+        finished = purge.purge_old_data(
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            deadline=start + PURGE_TIME_BUDGET,
+            progress=progress,
+        )
+        progress.elapsed += time.monotonic() - start
+        progress.finished = finished
+        instance.hass.add_job(instance.async_update_purge_checkpoint)
+        if finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -133,6 +155,17 @@ class PurgeTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class CreatePartitionsTask(RecorderTask):
+    """An object to insert into the recorder queue to create upcoming partitions."""
+
+    def run(self, instance: Recorder) -> None:
+        """Create the partitions of the next days."""
+        assert instance.engine is not None
+        with instance.engine.begin() as connection:
+            partition.create_partitions(connection, dt_util.utcnow())
+
+
 @dataclass(slots=True)
 class PurgeEntitiesTask(RecorderTask):
     """Object to store entity information about purge task."""
@@ -187,6 +220,18 @@ class CompileMissingStatisticsTask(RecorderTask):
         instance.queue_task(CompileMissingStatisticsTask())
 
 
+@dataclass(slots=True)
+class RollUpStatisticsTask(RecorderTask):
+    """An object to insert into the recorder queue to roll up statistics."""
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics task to roll up daily, weekly and monthly statistics."""
+        if statistics.roll_up_statistics(instance):
+            return
+        # Schedule a new roll up task if this one didn't finish
+        instance.queue_task(RollUpStatisticsTask())
+
+
 @dataclass(slots=True)
 class ImportStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an import statistics task."""
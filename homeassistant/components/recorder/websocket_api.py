@@ -84,6 +84,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_get_statistics_during_period)
     websocket_api.async_register_command(hass, ws_get_statistics_metadata)
     websocket_api.async_register_command(hass, ws_list_statistic_ids)
+    websocket_api.async_register_command(hass, ws_purge_progress)
     websocket_api.async_register_command(hass, ws_import_statistics)
     websocket_api.async_register_command(hass, ws_update_statistics_issues)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
@@ -298,6 +299,25 @@ async def ws_validate_statistics(
     connection.send_result(msg["id"], statistic_ids)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/purge_progress",
+    }
+)
+@callback
+def ws_purge_progress(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the progress of the running or last purge."""
+    if (progress := get_instance(hass).purge_progress) is None:
+        connection.send_result(msg["id"], None)
+        return
+    connection.send_result(
+        msg["id"],
+        progress.as_dict() | {"rows_per_second": progress.rows_per_second},
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "recorder/update_statistics_issues",
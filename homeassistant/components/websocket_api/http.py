@@ -25,6 +25,7 @@ from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
     DATA_CONNECTIONS,
     MAX_PENDING_MSG,
+    PENDING_MSG_COALESCE,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
@@ -33,7 +34,11 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json_bytes
+from .messages import (
+    MessageDeflater,
+    coalesce_state_diff_messages,
+    message_to_json_bytes,
+)
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -82,6 +87,9 @@ class WebSocketHandler:
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
+        "_coalesce_queue_size",
+        "_coalesce_count",
+        "_coalesced_message_count",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -105,6 +113,10 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        # Pending state diffs are coalesced once the queue reaches this size
+        self._coalesce_queue_size = PENDING_MSG_COALESCE
+        self._coalesce_count = 0
+        self._coalesced_message_count = 0
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -112,6 +124,8 @@ class WebSocketHandler:
             "<WebSocketHandler "
             f"closing={self._closing} "
             f"authenticated={self._authenticated} "
+            f"pending_messages={len(self._message_queue or ())} "
+            f"coalesced_messages={self._coalesced_message_count} "
             f"description={self.description}>"
         )
 
@@ -128,6 +142,7 @@ class WebSocketHandler:
         self,
         connection: ActiveConnection,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> None:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
@@ -138,11 +153,13 @@ class WebSocketHandler:
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = connection.can_coalesce
+        deflater: MessageDeflater | None = None
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
                 if not message_queue:
+                    self._coalesce_queue_size = PENDING_MSG_COALESCE
                     self._ready_future = loop.create_future()
                     ready_message_count = await self._ready_future
 
@@ -153,11 +170,29 @@ class WebSocketHandler:
                     # coalesce may be enabled later in the connection
                     can_coalesce = connection.can_coalesce
 
+                if deflater is None and connection.can_compress:
+                    # The messages are compressed by the deflater from now on
+                    # so the websocket must no longer compress the frames
+                    if (ws_writer := wsock._writer) is not None:  # noqa: SLF001
+                        ws_writer.compress = 0
+                    deflater = MessageDeflater()
+
                 if not can_coalesce or ready_message_count == 1:
                     message = message_queue.popleft()
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
+                    if deflater is None:
+                        await send_bytes_text(message)
+                    else:
+                        await send_bytes_binary(deflater.deflate((message,), False))
+                    continue
+
+                if deflater is not None:
+                    if is_debug_log_enabled():
+                        debug("%s: Sending %s", self.description, list(message_queue))
+                    compressed_messages = deflater.deflate(message_queue, True)
+                    message_queue.clear()
+                    await send_bytes_binary(compressed_messages)
                     continue
 
                 coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
@@ -203,15 +238,20 @@ class WebSocketHandler:
 
         message_queue = self._message_queue
         message_queue.append(message)
-        if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
+        queue_size_after_add = len(message_queue)
+        if queue_size_after_add >= self._coalesce_queue_size:
+            queue_size_after_add = self._coalesce_pending_messages()
+
+        if queue_size_after_add >= MAX_PENDING_MSG:
             self._logger.error(
                 (
                     "%s: Client unable to keep up with pending messages. Reached %s pending"
-                    " messages. The system's load is too high or an integration is"
-                    " misbehaving; Last message was: %s"
+                    " messages after coalescing %s messages. The system's load is too"
+                    " high or an integration is misbehaving; Last message was: %s"
                 ),
                 self.description,
                 MAX_PENDING_MSG,
+                self._coalesced_message_count,
                 message,
             )
             self._cancel()
@@ -234,6 +274,36 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def _coalesce_pending_messages(self) -> int:
+        """Merge the pending state diffs of each entity.
+
+        Only the final state of an entity matters to a client which can not
+        keep up, so its pending diffs are merged instead of disconnecting it.
+        Returns the new queue size.
+        """
+        message_queue = self._message_queue
+        queue_size = len(message_queue)
+        coalesced = coalesce_state_diff_messages(message_queue)
+        message_queue.clear()
+        message_queue.extend(coalesced)
+        coalesced_size = len(message_queue)
+        self._coalesce_count += 1
+        self._coalesced_message_count += queue_size - coalesced_size
+        # Coalesce again once the queue doubled to keep the cost linear
+        self._coalesce_queue_size = min(
+            max(PENDING_MSG_COALESCE, coalesced_size * 2), MAX_PENDING_MSG
+        )
+        self._logger.debug(
+            "%s: Coalesced %s pending messages to %s (%s times, %s messages in total)",
+            self.description,
+            queue_size,
+            coalesced_size,
+            self._coalesce_count,
+            self._coalesced_message_count,
+        )
+        return coalesced_size
+
     @callback
     def _release_ready_future_or_reschedule(self) -> None:
         """Release the ready future or reschedule.
@@ -335,6 +405,7 @@ class WebSocketHandler:
             send_frame = writer._send_frame  # noqa: SLF001
 
         send_bytes_text = partial(send_frame, opcode=WSMsgType.TEXT)
+        send_bytes_binary = partial(send_frame, opcode=WSMsgType.BINARY)
         auth = AuthPhase(
             logger, hass, self._send_message, self._cancel, request, send_bytes_text
         )
@@ -342,7 +413,9 @@ class WebSocketHandler:
         disconnect_warn: str | None = None
 
         try:
-            connection = await self._async_handle_auth_phase(auth, send_bytes_text)
+            connection = await self._async_handle_auth_phase(
+                auth, send_bytes_text, send_bytes_binary
+            )
             self._async_increase_writer_limit(writer)
             await self._async_websocket_command_phase(connection, send_bytes_text)
         except asyncio.CancelledError:
@@ -377,6 +450,7 @@ class WebSocketHandler:
         self,
         auth: AuthPhase,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        send_bytes_binary: Callable[[bytes], Coroutine[Any, Any, None]],
     ) -> ActiveConnection:
         """Handle the auth phase of the websocket connection."""
         await send_bytes_text(AUTH_REQUIRED_MESSAGE)
@@ -407,7 +481,9 @@ class WebSocketHandler:
         # We only start the writer queue after the auth phase is completed
         # since there is no need to queue messages before the auth phase
         self._connection = connection
-        self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
+        self._writer_task = create_eager_task(
+            self._writer(connection, send_bytes_text, send_bytes_binary)
+        )
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
 
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from functools import lru_cache
 import logging
+from struct import Struct
 from typing import Any, Final
+import zlib
 
 import voluptuous as vol
 
@@ -14,8 +17,9 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_CHANGED,
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
+    EVENT_STATE_CHANGED,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -60,6 +64,126 @@ INVALID_JSON_PARTIAL_MESSAGE = json_bytes(
 )
 
 
+# The final empty block which ends a raw deflate stream
+DEFLATE_FINAL_BLOCK: Final = b"\x03\x00"
+DEFLATE_LEVEL: Final = 6
+# The header of a non-final stored block: BFINAL and BTYPE, LEN and NLEN
+_STORED_BLOCK_HEADER: Final = Struct("<BHH")
+
+
+class PartialCachedMessage(bytes):
+    """A message made of a partial message shared by all connections.
+
+    The message is the partial message without its closing brace followed
+    by the message id. Keeping a reference to the cached partial message
+    allows it to be compressed once for all connections.
+    """
+
+    partial: bytes
+
+
+class StateDiffMessage(PartialCachedMessage):
+    """A state diff message of a subscribe_entities subscription.
+
+    Keeping a reference to the event allows the pending diffs of an entity
+    to be merged when the client can not keep up.
+    """
+
+    message_id_as_bytes: bytes
+    event: Event[EventStateChangedData]
+
+
+def _partial_cached_message[_PartialCachedMessageT: PartialCachedMessage](
+    message_class: type[_PartialCachedMessageT],
+    partial_message: bytes,
+    message_id_as_bytes: bytes,
+) -> _PartialCachedMessageT:
+    """Return a message from a cached partial message and a message id."""
+    message = message_class(
+        b"".join((partial_message[:-1], b',"id":', message_id_as_bytes, b"}"))
+    )
+    message.partial = partial_message
+    return message
+
+
+def _stored_block(data: bytes) -> bytes:
+    """Return data as a non-final stored block of a raw deflate stream."""
+    return _STORED_BLOCK_HEADER.pack(0, len(data), len(data) ^ 0xFFFF) + data
+
+
+def _deflate_compressor() -> zlib._Compress:
+    """Return a compressor which writes a raw deflate stream."""
+    return zlib.compressobj(DEFLATE_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+
+
+@lru_cache(maxsize=128)
+def _deflate_partial_message(partial_message: bytes) -> bytes:
+    """Compress a cached partial message without its closing brace.
+
+    Compress once per message since the same partial message
+    is sent to all connections subscribed to the event.
+    """
+    body = partial_message[:-1]
+    compressor = _deflate_compressor()
+    compressed = compressor.compress(body) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    if len(compressed) < len(body) + _STORED_BLOCK_HEADER.size:
+        return compressed
+    # Small messages do not compress without the context of earlier messages
+    return _stored_block(body)
+
+
+class MessageDeflater:
+    """Compress outgoing messages of a connection to raw deflate streams.
+
+    The compressor history is reset after every chunk so the output
+    never refers to data outside of the chunk. This allows the compressed
+    partial messages shared by all connections to be copied into the
+    stream as is.
+    """
+
+    __slots__ = ("_compressor",)
+
+    def __init__(self) -> None:
+        """Initialize the deflater."""
+        self._compressor = _deflate_compressor()
+
+    def _deflate_chunk(self, pending: list[bytes], compress: bool) -> bytes:
+        """Compress a chunk which does not refer to earlier chunks."""
+        data = b"".join(pending)
+        if not compress:
+            # Storing the few bytes of separators and message ids
+            # is cheaper and smaller than compressing them
+            return _stored_block(data)
+        compressor = self._compressor
+        return compressor.compress(data) + compressor.flush(zlib.Z_FULL_FLUSH)
+
+    def deflate(self, messages: Iterable[bytes], coalesce: bool) -> bytes:
+        """Compress a single message or coalesce messages in a JSON array."""
+        chunks: list[bytes] = []
+        pending: list[bytes] = []
+        pending_messages = False
+        separator = b"["
+        for message in messages:
+            if coalesce:
+                pending.append(separator)
+                separator = b","
+            if isinstance(message, PartialCachedMessage):
+                partial_message = message.partial
+                if pending:
+                    chunks.append(self._deflate_chunk(pending, pending_messages))
+                chunks.append(_deflate_partial_message(partial_message))
+                pending = [message[len(partial_message) - 1 :]]
+                pending_messages = False
+            else:
+                pending.append(message)
+                pending_messages = True
+        if coalesce:
+            pending.append(b"]")
+        chunks.append(self._deflate_chunk(pending, pending_messages))
+        chunks.append(DEFLATE_FINAL_BLOCK)
+        return b"".join(chunks)
+
+
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
     """Return a success result message."""
     return {"id": iden, "type": const.TYPE_RESULT, "success": True, "result": result}
@@ -118,13 +242,8 @@ def cached_event_message(message_id_as_bytes: bytes, event: Event) -> bytes:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return b"".join(
-        (
-            _partial_cached_event_message(event)[:-1],
-            b',"id":',
-            message_id_as_bytes,
-            b"}",
-        )
+    return _partial_cached_message(
+        PartialCachedMessage, _partial_cached_event_message(event), message_id_as_bytes
     )
 
 
@@ -152,19 +271,27 @@ def cached_state_diff_message(
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return b"".join(
-        (
-            _partial_cached_state_diff_message(event)[:-1],
-            b',"id":',
-            message_id_as_bytes,
-            b"}",
-        )
+    return _state_diff_message(
+        message_id_as_bytes, event, _partial_cached_state_diff_message(event)
     )
 
 
-@lru_cache(maxsize=128)
-def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
-    """Cache and serialize the event to json.
+def _state_diff_message(
+    message_id_as_bytes: bytes,
+    event: Event[EventStateChangedData],
+    partial_message: bytes,
+) -> StateDiffMessage:
+    """Return a state diff message from its partial message."""
+    message = _partial_cached_message(
+        StateDiffMessage, partial_message, message_id_as_bytes
+    )
+    message.message_id_as_bytes = message_id_as_bytes
+    message.event = event
+    return message
+
+
+def _partial_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
+    """Serialize the event to json.
 
     The message is constructed without the id which
     will be appended in cached_state_diff_message
@@ -177,6 +304,65 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     )
 
 
+_partial_cached_state_diff_message = lru_cache(maxsize=128)(_partial_state_diff_message)
+
+
+def coalesce_state_diff_messages(messages: Iterable[bytes]) -> list[bytes]:
+    """Merge the state diff messages of each entity into a single message.
+
+    The diffs of an entity in a subscription are replaced with one diff
+    from the state before the first diff to the state of the last diff,
+    at the position of the last diff. Other messages are kept as is.
+    """
+    pending = list(messages)
+    first_old_states: dict[tuple[bytes, str], State | None] = {}
+    last_indexes: dict[tuple[bytes, str], int] = {}
+    state_diff_count = 0
+    for index, message in enumerate(pending):
+        if type(message) is StateDiffMessage:
+            data = message.event.data
+            key = (message.message_id_as_bytes, data["entity_id"])
+            if key not in first_old_states:
+                first_old_states[key] = data["old_state"]
+            last_indexes[key] = index
+            state_diff_count += 1
+
+    if state_diff_count == len(last_indexes):
+        # There is at most one diff per entity
+        return pending
+
+    coalesced: list[bytes] = []
+    for index, message in enumerate(pending):
+        if type(message) is not StateDiffMessage:
+            coalesced.append(message)
+            continue
+        data = message.event.data
+        entity_id = data["entity_id"]
+        key = (message.message_id_as_bytes, entity_id)
+        if last_indexes[key] != index:
+            continue
+        old_state = first_old_states[key]
+        new_state = data["new_state"]
+        if old_state is data["old_state"]:
+            coalesced.append(message)
+            continue
+        if old_state is None and new_state is None:
+            # The entity was added and removed again
+            continue
+        event = Event(
+            EVENT_STATE_CHANGED,
+            EventStateChangedData(
+                entity_id=entity_id, old_state=old_state, new_state=new_state
+            ),
+        )
+        coalesced.append(
+            _state_diff_message(
+                message.message_id_as_bytes, event, _partial_state_diff_message(event)
+            )
+        )
+    return coalesced
+
+
 def _state_diff_event(
     event: Event[EventStateChangedData],
 ) -> dict[
@@ -57,6 +57,7 @@ from homeassistant.exceptions import (
 from homeassistant.loader import async_suggest_report_issue, bind_hass
 from homeassistant.util import ensure_unique_string, slugify
 from homeassistant.util.frozen_dataclass_compat import FrozenOrThawed
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from . import device_registry as dr, entity_registry as er, singleton
 from .device_registry import DeviceInfo, EventDeviceRegistryUpdatedData
@@ -519,6 +520,9 @@ class Entity(
 
     __capabilities_updated_at: deque[float]
     __capabilities_updated_at_reported: bool = False
+    # The values the attributes of the last write were built from
+    __attributes_sources: tuple[Any, ...] | None = None
+    __attributes: ReadOnlyDict[str, Any]
     __remove_future: asyncio.Future[None] | None = None
 
     # Entity Properties
@@ -1041,11 +1045,13 @@ class Entity(
     def _async_calculate_state(self) -> CalculatedState:
         """Calculate state string and attribute mapping."""
         state, attr, capabilities, _, _ = self.__async_calculate_state()
-        return CalculatedState(state, attr, capabilities)
+        return CalculatedState(state, dict(attr), capabilities)
 
     def __async_calculate_state(
         self,
-    ) -> tuple[str, dict[str, Any], Mapping[str, Any] | None, str | None, int | None]:
+    ) -> tuple[
+        str, ReadOnlyDict[str, Any], Mapping[str, Any] | None, str | None, int | None
+    ]:
         """Calculate state string and attribute mapping.
 
         Returns a tuple:
@@ -1057,50 +1063,99 @@ class Entity(
 
         This method is called when writing the state to avoid the overhead of creating
         a dataclass object.
+
+        The attribute dictionary of the last write is returned again if the
+        values it is built from are unchanged. Since it is the same object
+        as the attributes of the current state, the state machine does not
+        have to compare the attributes.
         """
         entry = self.registry_entry
 
         capability_attr = self.capability_attributes
-        attr = capability_attr.copy() if capability_attr else {}
-
         available = self.available  # only call self.available once per update cycle
         state = self._stringify_state(available)
         if available:
-            if state_attributes := self.state_attributes:
-                attr.update(state_attributes)
-            if extra_state_attributes := self.extra_state_attributes:
-                attr.update(extra_state_attributes)
+            state_attributes = self.state_attributes
+            extra_state_attributes = self.extra_state_attributes
+        else:
+            state_attributes = extra_state_attributes = None
+        unit_of_measurement = self.unit_of_measurement
+        assumed_state = self.assumed_state
+        attribution = self.attribution
+        original_device_class = self.device_class
+        device_class = (entry and entry.device_class) or original_device_class
+        entity_picture = self.entity_picture
+        icon = (entry and entry.icon) or self.icon
+        name = (entry and entry.name) or self._friendly_name_internal()
+        supported_features = self.supported_features
+
+        attributes_sources = (
+            capability_attr,
+            state_attributes,
+            extra_state_attributes,
+            unit_of_measurement,
+            assumed_state,
+            attribution,
+            device_class,
+            entity_picture,
+            icon,
+            name,
+            supported_features,
+        )
+        if attributes_sources == self.__attributes_sources:
+            return (
+                state,
+                self.__attributes,
+                capability_attr,
+                original_device_class,
+                supported_features,
+            )
 
-        if (unit_of_measurement := self.unit_of_measurement) is not None:
+        attr = capability_attr.copy() if capability_attr else {}
+        if state_attributes:
+            attr.update(state_attributes)
+        if extra_state_attributes:
+            attr.update(extra_state_attributes)
+
+        if unit_of_measurement is not None:
             attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
 
-        if assumed_state := self.assumed_state:
+        if assumed_state:
             attr[ATTR_ASSUMED_STATE] = assumed_state
 
-        if (attribution := self.attribution) is not None:
+        if attribution is not None:
             attr[ATTR_ATTRIBUTION] = attribution
 
-        original_device_class = self.device_class
-        if (
-            device_class := (entry and entry.device_class) or original_device_class
-        ) is not None:
+        if device_class is not None:
             attr[ATTR_DEVICE_CLASS] = str(device_class)
 
-        if (entity_picture := self.entity_picture) is not None:
+        if entity_picture is not None:
             attr[ATTR_ENTITY_PICTURE] = entity_picture
 
-        if (icon := (entry and entry.icon) or self.icon) is not None:
+        if icon is not None:
             attr[ATTR_ICON] = icon
 
-        if (
-            name := (entry and entry.name) or self._friendly_name_internal()
-        ) is not None:
+        if name is not None:
             attr[ATTR_FRIENDLY_NAME] = name
 
-        if (supported_features := self.supported_features) is not None:
+        if supported_features is not None:
             attr[ATTR_SUPPORTED_FEATURES] = supported_features
 
-        return (state, attr, capability_attr, original_device_class, supported_features)
+        # Mappings are copied as they may be modified in place
+        self.__attributes_sources = (
+            capability_attr and dict(capability_attr),
+            state_attributes and dict(state_attributes),
+            extra_state_attributes and dict(extra_state_attributes),
+            *attributes_sources[3:],
+        )
+        self.__attributes = ReadOnlyDict(attr)
+        return (
+            state,
+            self.__attributes,
+            capability_attr,
+            original_device_class,
+            supported_features,
+        )
 
     @callback
     def _async_write_ha_state(self) -> None:
@@ -1196,7 +1251,7 @@ class Entity(
         else:
             # Overwrite properties that have been set in the config file.
             if custom := customize.get(entity_id):
-                attr.update(custom)
+                attr = ReadOnlyDict({**attr, **custom})
 
         if (
             self._context_set is not None
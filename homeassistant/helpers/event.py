@@ -63,6 +63,9 @@ _TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = Hass
 _TRACK_STATE_REPORT_DATA: HassKey[_KeyedEventData[EventStateReportedData]] = HassKey(
     "track_state_report_data"
 )
+_TRACK_STATE_CHANGE_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
+    HassKey("track_state_change_domain_data")
+)
 _TRACK_STATE_ADDED_DOMAIN_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = (
     HassKey("track_state_added_domain_data")
 )
@@ -612,6 +615,55 @@ def _async_dispatch_domain_event(
             )
 
 
+@callback
+def _async_dispatch_domain_event_soon(
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
+    event: Event[EventStateChangedData],
+) -> None:
+    """Dispatch to domain listeners soon to ensure one event loop runs before dispatch."""
+    hass.loop.call_soon(_async_dispatch_domain_event, hass, callbacks, event)
+
+
+@callback
+def _async_domain_filter(
+    hass: HomeAssistant,
+    callbacks: dict[str, list[HassJob[[Event[EventStateChangedData]], Any]]],
+    event_data: EventStateChangedData,
+) -> bool:
+    """Filter state changes by domain."""
+    return (
+        MATCH_ALL in callbacks
+        or split_entity_id(event_data["entity_id"])[0] in callbacks
+    )
+
+
+_KEYED_TRACK_STATE_CHANGE_DOMAIN = _KeyedEventTracker(
+    key=_TRACK_STATE_CHANGE_DOMAIN_DATA,
+    event_type=EVENT_STATE_CHANGED,
+    dispatcher_callable=_async_dispatch_domain_event_soon,
+    filter_callable=_async_domain_filter,
+)
+
+
+@bind_hass
+def _async_track_state_change_domain(
+    hass: HomeAssistant,
+    domains: str | Iterable[str],
+    action: Callable[[Event[EventStateChangedData]], Any],
+    job_type: HassJobType | None,
+) -> CALLBACK_TYPE:
+    """Track all state change events of entities in domains.
+
+    All trackers share a single state_changed listener which routes
+    each event with a dict lookup by domain. Passing MATCH_ALL as
+    domain tracks the state changes of all entities.
+    """
+    return _async_track_event(
+        _KEYED_TRACK_STATE_CHANGE_DOMAIN, hass, domains, action, job_type
+    )
+
+
 @callback
 def _async_domain_added_filter(
     hass: HomeAssistant,
@@ -806,8 +858,12 @@ class _TrackStateChangeFiltered:
     @callback
     def _setup_entities_listener(self, domains: set[str], entities: set[str]) -> None:
         if domains:
-            entities = entities.copy()
-            entities.update(self.hass.states.async_entity_ids(domains))
+            # The domains listener already covers entities in the tracked domains
+            entities = {
+                entity_id
+                for entity_id in entities
+                if split_entity_id(entity_id)[0] not in domains
+            }
 
         # Entities has changed to none
         if not entities:
@@ -817,27 +873,19 @@ class _TrackStateChangeFiltered:
             self.hass, entities, self._action, self._action_as_hassjob.job_type
         )
 
-    @callback
-    def _state_added(self, event: Event[EventStateChangedData]) -> None:
-        self._cancel_listener(_ENTITIES_LISTENER)
-        self._setup_entities_listener(
-            self._last_track_states.domains, self._last_track_states.entities
-        )
-        self.hass.async_run_hass_job(self._action_as_hassjob, event)
-
     @callback
     def _setup_domains_listener(self, domains: set[str]) -> None:
         if not domains:
             return
 
-        self._listeners[_DOMAINS_LISTENER] = _async_track_state_added_domain(
-            self.hass, domains, self._state_added, HassJobType.Callback
+        self._listeners[_DOMAINS_LISTENER] = _async_track_state_change_domain(
+            self.hass, domains, self._action, self._action_as_hassjob.job_type
         )
 
     @callback
     def _setup_all_listener(self) -> None:
-        self._listeners[_ALL_LISTENER] = self.hass.bus.async_listen(
-            EVENT_STATE_CHANGED, self._action
+        self._listeners[_ALL_LISTENER] = _async_track_state_change_domain(
+            self.hass, MATCH_ALL, self._action, self._action_as_hassjob.job_type
         )
 
 
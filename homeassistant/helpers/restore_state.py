@@ -5,6 +5,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 import logging
+import time
 from typing import Any, Self, cast
 
 from homeassistant.const import ATTR_RESTORED, EVENT_HOMEASSISTANT_STOP
@@ -18,7 +19,7 @@ from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes, json_fragment
 from .singleton import singleton
 from .storage import Store
 
@@ -139,6 +140,10 @@ class RestoreStateData:
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # The encoded state and extra data of the last dump by entity_id
+        self._encoded_states: dict[str, tuple[State, bytes]] = {}
+        self.last_dump_duration: float | None = None
+        self.last_dump_size: int | None = None
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -215,17 +220,53 @@ class RestoreStateData:
         return stored_states
 
     async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+        """Save the current state machine to storage.
+
+        Only stored states with a state written since the last dump
+        are encoded again, the others reuse their encoding.
+        """
         _LOGGER.debug("Dumping states")
-        try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+        start = time.monotonic()
+        encoded_states = self._encoded_states
+        to_encode: list[
+            tuple[State, bytes | None, dict[str, Any] | None, datetime]
+        ] = []
+        for stored_state in self.async_get_stored_states():
+            state = stored_state.state
+            if (encoded := encoded_states.get(state.entity_id)) is not None and encoded[
+                0
+            ] is state:
+                to_encode.append((state, encoded[1], None, stored_state.last_seen))
+                continue
+            extra_data = stored_state.extra_data
+            to_encode.append(
+                (
+                    state,
+                    None,
+                    extra_data.as_dict() if extra_data else None,
+                    stored_state.last_seen,
+                )
             )
+
+        encoded_count = sum(encoded is None for _, encoded, _, _ in to_encode)
+        fragments, self._encoded_states, size = await self.hass.async_add_executor_job(
+            _encode_stored_states, to_encode
+        )
+        try:
+            await self.store.async_save(fragments)
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+            return
+
+        self.last_dump_duration = time.monotonic() - start
+        self.last_dump_size = size
+        _LOGGER.debug(
+            "Dumped %s states (%s encoded) of %s bytes in %.3fs",
+            len(fragments),
+            encoded_count,
+            size,
+            self.last_dump_duration,
+        )
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -284,6 +325,41 @@ class RestoreStateData:
         del self.entities[entity_id]
 
 
+def _encode_stored_states(
+    to_encode: list[tuple[State, bytes | None, dict[str, Any] | None, datetime]],
+) -> tuple[list[json_fragment], dict[str, tuple[State, bytes]], int]:
+    """Encode the stored states.
+
+    Returns the stored states as json fragments, the encoded state and
+    extra data by entity_id for the next dump and the size of the dump.
+    """
+    fragments: list[json_fragment] = []
+    encoded_states: dict[str, tuple[State, bytes]] = {}
+    size = 0
+    for state, encoded, extra_data, last_seen in to_encode:
+        if encoded is None:
+            try:
+                encoded = b"".join(
+                    (
+                        b'{"state":',
+                        state.as_dict_json,
+                        b',"extra_data":',
+                        json_bytes(extra_data),
+                        b',"last_seen":',
+                    )
+                )
+            except TypeError:
+                _LOGGER.exception(
+                    "Error encoding the extra data of %s to JSON", state.entity_id
+                )
+                continue
+        encoded_states[state.entity_id] = (state, encoded)
+        stored_state = b"".join((encoded, json_bytes(last_seen), b"}"))
+        fragments.append(json_fragment(stored_state))
+        size += len(stored_state)
+    return fragments, encoded_states, size
+
+
 class RestoreEntity(Entity):
     """Mixin class for restoring previous entity state."""
 
@@ -7,10 +7,14 @@ from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
 import inspect
+from itertools import compress, count, islice
 from json import JSONDecodeError, JSONEncoder
 import logging
+import mmap
+from operator import is_not
 import os
 from pathlib import Path
+import time
 from typing import Any
 
 from propcache import cached_property
@@ -34,6 +38,7 @@ from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.uuid import random_uuid_hex
 
 from . import json as json_helper
 
@@ -49,6 +54,12 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into the snapshot once it grows
+# past this fraction of the snapshot size
+JOURNAL_COMPACT_RATIO = 0.25
+JOURNAL_COMPACT_MIN_SIZE = 65536
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -115,6 +126,7 @@ class _StoreManager:
         self._invalidated: set[str] = set()
         self._files: set[str] | None = None
         self._data_preload: dict[str, json_util.JsonValueType] = {}
+        self._preload_times: dict[str, float] = {}
         self._storage_path: Path = Path(hass.config.config_dir).joinpath(STORAGE_DIR)
         self._cancel_cleanup: asyncio.TimerHandle | None = None
 
@@ -204,10 +216,30 @@ class _StoreManager:
         self._data_preload.clear()
 
     async def async_preload(self, keys: Iterable[str]) -> None:
-        """Cache the keys."""
+        """Cache the keys.
+
+        The files are read by up to MAX_LOAD_CONCURRENTLY executor jobs
+        so slow storage serves several reads at once.
+        """
         # If async_initialize has not been called yet, we can't preload
-        if self._files is not None and (existing := self._files.intersection(keys)):
-            await self._hass.async_add_executor_job(self._preload, existing)
+        if self._files is None or not (existing := self._files.intersection(keys)):
+            return
+        keys_by_job = [
+            list(islice(sorted(existing), job, None, MAX_LOAD_CONCURRENTLY))
+            for job in range(min(len(existing), MAX_LOAD_CONCURRENTLY))
+        ]
+        start = time.monotonic()
+        await asyncio.gather(
+            *(
+                self._hass.async_add_executor_job(self._preload, job_keys)
+                for job_keys in keys_by_job
+            )
+        )
+        _LOGGER.debug(
+            "Preloaded %s storage files in %.3fs",
+            len(existing),
+            time.monotonic() - start,
+        )
 
     def _preload(self, keys: Iterable[str]) -> None:
         """Cache the keys."""
@@ -215,11 +247,14 @@ class _StoreManager:
         data_preload = self._data_preload
         for key in keys:
             storage_file: Path = storage_path.joinpath(key)
+            start = time.monotonic()
             try:
-                if storage_file.is_file():
-                    data_preload[key] = json_util.load_json(storage_file)
+                data_preload[key] = _load_json_mmap(storage_file)
             except Exception as ex:  # noqa: BLE001
                 _LOGGER.debug("Error loading %s: %s", key, ex)
+                continue
+            self._preload_times[key] = load_time = time.monotonic() - start
+            _LOGGER.debug("Preloaded %s in %.3fs", key, load_time)
 
     def _initialize_files(self) -> None:
         """Initialize the cache."""
@@ -242,8 +277,16 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        In journal mode the data must be a dict of lists of items with an
+        id. Saves append the changed and removed items to a journal file
+        instead of rewriting the whole file. Items are compared by identity
+        so unchanged items must be returned as the same object, e.g. as a
+        cached json_fragment.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -259,12 +302,22 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = journal
+        self._journal_token: str | None = None
+        self._journal_items: dict[str, list[Any]] | None = None
+        self._journal_size = 0
+        self._snapshot_size = 0
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -326,6 +379,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            if self._journal:
+                data = await self.hass.async_add_executor_job(self._load_journal, data)
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -387,6 +442,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
             if data == {}:
                 return None
+            if self._journal:
+                data = await self.hass.async_add_executor_job(self._load_journal, data)
 
         # Add minor_version if not set
         if "minor_version" not in data:
@@ -552,6 +609,12 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal:
+            if self._append_journal(data["data"]):
+                return
+            # Journal records of older snapshots are ignored
+            data["journal"] = random_uuid_hex()
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -561,6 +624,136 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+        if self._journal:
+            self._reset_journal(path, data)
+
+    def _load_journal(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Apply the journal records of the snapshot to its data."""
+        try:
+            with open(self.journal_path, "rb") as fdesc:
+                records = fdesc.read().splitlines()
+        except FileNotFoundError:
+            return data
+
+        token = data.get("journal")
+        stored = data["data"]
+        indexes: dict[str, dict[str, Any]] = {}
+        for line in records:
+            try:
+                record = json_util.json_loads(line)
+            except json_util.JSON_DECODE_EXCEPTIONS:
+                # The last record is incomplete after an unclean shutdown
+                _LOGGER.warning("Ignoring incomplete journal record of %s", self.key)
+                break
+            if token is None or record["snapshot"] != token:
+                continue
+            for key, changes in record["data"].items():
+                if (index := indexes.get(key)) is None:
+                    index = indexes[key] = {item["id"]: item for item in stored[key]}
+                for item in changes["set"]:
+                    index[item["id"]] = item
+                for item_id in changes["remove"]:
+                    index.pop(item_id, None)
+
+        _LOGGER.debug("Loaded %s journal records for %s", len(records), self.key)
+        for key, index in indexes.items():
+            stored[key] = list(index.values())
+        return data
+
+    def _append_journal(self, stored: Any) -> bool:
+        """Append the changed items to the journal.
+
+        Returns False if the data has to be written as a new snapshot.
+        """
+        if (
+            (journal_items := self._journal_items) is None
+            or not isinstance(stored, dict)
+            or stored.keys() != journal_items.keys()
+        ):
+            return False
+
+        changes: dict[str, dict[str, list[Any]]] = {}
+        items: dict[str, list[Any]] = {}
+        for key, values in stored.items():
+            if not isinstance(values, list):
+                return False
+            previous = journal_items[key]
+            values = items[key] = values.copy()
+            # Only the items at positions with a different item can have
+            # changed, which are few as long as the items keep their order
+            positions = list(compress(count(), map(is_not, values, previous)))
+            common = min(len(values), len(previous))
+            new = [values[position] for position in positions]
+            new.extend(values[common:])
+            old = [previous[position] for position in positions]
+            old.extend(previous[common:])
+            new_ids = set(map(id, new))
+            old_ids = set(map(id, old))
+            changed = [value for value in new if id(value) not in old_ids]
+            removed = [value for value in old if id(value) not in new_ids]
+            if not changed and not removed:
+                continue
+            changed_ids = {_journal_item_id(value) for value in changed}
+            removed_ids = {_journal_item_id(value) for value in removed} - changed_ids
+            if None in changed_ids or None in removed_ids:
+                return False
+            changes[key] = {"set": changed, "remove": list(removed_ids)}
+
+        if not changes:
+            return True
+
+        try:
+            record = json_helper.json_bytes(
+                {"snapshot": self._journal_token, "data": changes}
+            )
+        except TypeError:
+            return False
+        if self._journal_size + len(record) > max(
+            JOURNAL_COMPACT_MIN_SIZE, self._snapshot_size * JOURNAL_COMPACT_RATIO
+        ):
+            return False
+
+        _LOGGER.debug("Appending journal record for %s", self.key)
+        try:
+            with os.fdopen(
+                os.open(
+                    self.journal_path,
+                    os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                    0o600 if self._private else 0o644,
+                ),
+                "ab",
+            ) as fdesc:
+                fdesc.write(record + b"\n")
+                if self._atomic_writes:
+                    fdesc.flush()
+                    os.fsync(fdesc.fileno())
+        except OSError as err:
+            # A partially written record is ignored when loading
+            self._journal_items = None
+            raise WriteError(err) from err
+
+        self._journal_items = items
+        self._journal_size += len(record) + 1
+        return True
+
+    def _reset_journal(self, path: str, data: dict[str, Any]) -> None:
+        """Start a new journal after writing a snapshot."""
+        with suppress(FileNotFoundError):
+            os.unlink(self.journal_path)
+        stored = data["data"]
+        self._journal_token = data["journal"]
+        self._journal_items = (
+            {
+                key: values.copy()
+                for key, values in stored.items()
+                if isinstance(values, list)
+            }
+            if isinstance(stored, dict)
+            else None
+        )
+        self._journal_size = 0
+        self._snapshot_size = os.path.getsize(path)
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -573,3 +766,30 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal:
+            self._journal_items = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+def _load_json_mmap(path: Path) -> json_util.JsonValueType:
+    """Load a JSON file by parsing a memory map of it.
+
+    This avoids copying the file into a bytes object before parsing.
+    """
+    with (
+        open(path, "rb") as fdesc,
+        mmap.mmap(fdesc.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+        memoryview(buffer) as view,
+    ):
+        return json_util.json_loads(view)
+
+
+def _journal_item_id(item: Any) -> Any:
+    """Return the id of a journaled item."""
+    if isinstance(item, json_helper.json_fragment):
+        item = json_util.json_loads(json_helper.json_bytes(item))
+    if isinstance(item, dict):
+        return item.get("id")
+    return None
@@ -12,8 +12,10 @@ from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -44,7 +46,9 @@ from homeassistant.const import (
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
@@ -52,6 +56,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     ServiceResponse,
     State,
@@ -69,6 +74,7 @@ from homeassistant.util import (
     slugify as slugify_util,
 )
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.file import WriteError, write_utf8_file
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
@@ -85,6 +91,7 @@ from . import (
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import STORAGE_DIR
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -102,6 +109,10 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_BYTECODE_CACHE: HassKey[TemplateBytecodeCache] = HassKey("template.bytecode_cache")
+
+# Compiled templates are persisted between restarts in this file in .storage
+TEMPLATE_BYTECODE_FILE = "core.template_bytecode"
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -2808,6 +2819,93 @@ def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     return result
 
 
+async def async_load_bytecode_cache(hass: HomeAssistant) -> None:
+    """Load the compiled templates of the previous run."""
+    bytecode_cache = TemplateBytecodeCache(
+        hass.config.path(STORAGE_DIR, TEMPLATE_BYTECODE_FILE)
+    )
+    await hass.async_add_executor_job(bytecode_cache.load)
+    hass.data[_BYTECODE_CACHE] = bytecode_cache
+
+    async def _async_save(_: Event) -> None:
+        if bytecode_cache.dirty:
+            await hass.async_add_executor_job(bytecode_cache.save)
+
+    # Most templates are compiled while starting up
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, _async_save)
+
+
+class TemplateBytecodeCache:
+    """Persist the compiled code of templates between restarts.
+
+    Compiled code is keyed by the template source and the flags of the
+    environment which compiled it. Only the code of templates compiled
+    or loaded during this run is saved so templates which have been
+    removed from the configuration are dropped.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the bytecode cache."""
+        self.path = path
+        self.dirty = False
+        self._loaded: dict[str, CodeType] = {}
+        self._used: dict[str, CodeType] = {}
+
+    @staticmethod
+    def _header() -> bytes:
+        """Return the header which invalidates the cache on upgrades."""
+        return MAGIC_NUMBER + f"jinja2-{jinja2.__version__}\n".encode()
+
+    def load(self) -> None:
+        """Load the cache file."""
+        header = self._header()
+        try:
+            with open(self.path, "rb") as fp:
+                data = fp.read()
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            _LOGGER.warning("Could not read template bytecode cache: %s", err)
+            return
+        if not data.startswith(header):
+            _LOGGER.debug("Discarding template bytecode cache of another version")
+            return
+        try:
+            loaded = marshal.loads(data[len(header) :])
+        except (EOFError, ValueError, TypeError) as err:
+            _LOGGER.warning("Discarding corrupt template bytecode cache: %s", err)
+            return
+        if isinstance(loaded, dict):
+            self._loaded = loaded
+
+    def save(self) -> None:
+        """Save the compiled templates used during this run."""
+        self.dirty = False
+        try:
+            write_utf8_file(
+                self.path,
+                self._header() + marshal.dumps(self._used),
+                private=True,
+                mode="wb",
+            )
+        except WriteError as err:
+            _LOGGER.warning("Could not save template bytecode cache: %s", err)
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the compiled code of a template."""
+        if (code := self._used.get(key)) is not None:
+            return code
+        if (code := self._loaded.pop(key, None)) is not None:
+            self._used[key] = code
+        return code
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Store the compiled code of a template."""
+        self._used[key] = code
+        self.dirty = True
+
+
 @singleton(_HASS_LOADER)
 def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
@@ -2854,6 +2952,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self._bytecode_prefix = f"{int(bool(limited))}{int(bool(strict))}:"
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3209,7 +3308,19 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            not isinstance(source, str)
+            or self.hass is None
+            or (bytecode_cache := self.hass.data.get(_BYTECODE_CACHE)) is None
+        ):
+            compiled = super().compile(source)
+            self.template_cache[source] = compiled
+            return compiled
+
+        key = self._bytecode_prefix + source
+        if (compiled := bytecode_cache.get(key)) is None:
+            compiled = super().compile(source)
+            bytecode_cache.set(key, compiled)
         self.template_cache[source] = compiled
         return compiled
 
@@ -31,3 +31,17 @@ def test_lazy_event_partial_state_context() -> None:
     assert state.event_type == "event_type"
     assert state.entity_id == "entity_id"
     assert state.state == "state"
+
+
+def test_lazy_event_partial_state_data_decoded_on_access() -> None:
+    """Test the event data is only decoded when accessed and is cached."""
+    row = (1, "event_type", '{"entity_id":"light.kitchen"}', 1, None, None, None)
+    event_data_cache: dict = {}
+    state = LazyEventPartialState(row, event_data_cache)
+    assert event_data_cache == {}
+    assert state.data == {"entity_id": "light.kitchen"}
+    assert event_data_cache == {
+        '{"entity_id":"light.kitchen"}': {"entity_id": "light.kitchen"}
+    }
+    other_state = LazyEventPartialState(row, event_data_cache)
+    assert other_state.data is state.data
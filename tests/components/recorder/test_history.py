@@ -21,8 +21,9 @@ from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant, State
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .common import (
     assert_dict_of_states_equal_without_context_and_last_changed,
@@ -637,6 +638,103 @@ async def test_get_significant_states_are_ordered(
     assert list(hist.keys()) == entity_ids
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+async def test_get_significant_states_json_fragments(
+    hass: HomeAssistant, minimal_response: bool
+) -> None:
+    """Test the JSON fragments match the compressed significant states."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    entity_ids = ["thermostat.test", "sensor.not_recorded", "media_player.test"]
+    hist = history.get_significant_states(
+        hass,
+        zero,
+        four,
+        entity_ids,
+        minimal_response=minimal_response,
+        compressed_state_format=True,
+    )
+    fragments, last_time_ts = history.get_significant_states_json_fragments(
+        hass, zero, four, entity_ids, minimal_response=minimal_response
+    )
+    assert list(fragments) == ["thermostat.test", "media_player.test"]
+    assert json_loads(json_bytes(fragments)) == json_loads(json_bytes(hist))
+    assert last_time_ts == max(
+        states[entity_id][-1].last_updated_timestamp
+        for entity_id in ("thermostat.test", "media_player.test")
+    )
+
+    assert history.get_significant_states_json_fragments(
+        hass, zero, four, ["sensor.not_recorded"]
+    ) == ({}, 0.0)
+
+
+@pytest.mark.parametrize("include_start_time_state", [True, False])
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+async def test_get_recent_significant_states_json_fragments(
+    hass: HomeAssistant,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Test the recent history returns the same states as the database."""
+    zero, four, _ = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    start = zero + timedelta(seconds=1.5)
+    entity_ids = [
+        "media_player.test",
+        "media_player.test3",
+        "thermostat.test",
+        "thermostat.test3",
+    ]
+    recent_states = history.async_get_recent_states(hass, entity_ids, start)
+    assert recent_states is not None
+    fragments, last_time_ts = history.get_significant_states_json_fragments(
+        hass,
+        start,
+        four,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    )
+    recent_fragments, recent_last_time_ts = (
+        history.get_recent_significant_states_json_fragments(
+            hass,
+            recent_states,
+            start,
+            four,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    )
+    assert json_loads(json_bytes(recent_fragments)) == json_loads(json_bytes(fragments))
+    assert recent_last_time_ts == last_time_ts
+
+
+async def test_async_get_recent_states_not_covered(hass: HomeAssistant) -> None:
+    """Test the recent history is only used when it covers the start time."""
+    zero, four, _ = record_states(hass)
+    await async_wait_recording_done(hass)
+
+    assert history.async_get_recent_states(hass, ["media_player.test"], zero) is None
+    assert (
+        history.async_get_recent_states(
+            hass, ["media_player.test", "sensor.not_recorded"], four
+        )
+        is None
+    )
+    assert history.async_get_recent_states(hass, ["media_player.test"], four)
+
+
 async def test_get_significant_states_only(
     hass: HomeAssistant,
 ) -> None:
@@ -60,6 +60,7 @@ from homeassistant.components.recorder.services import (
 )
 from homeassistant.components.recorder.table_managers import (
     state_attributes as state_attributes_table_manager,
+    states as states_table_manager,
     states_meta as states_meta_table_manager,
 )
 from homeassistant.components.recorder.util import session_scope
@@ -134,8 +135,10 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         uri="sqlite://",
         db_max_retries=10,
         db_retry_wait=3,
+        db_partitioning=False,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_event_types=set(),
+        recent_history_max_states=0,
     )
 
 
@@ -384,31 +387,55 @@ async def test_saving_state_with_intermixed_time_changes(
         assert db_states[0].event_id is None
 
 
+def _set_bulk_insert_states(hass: HomeAssistant, bulk_insert_states: bool) -> Recorder:
+    """Select how states are written and skip if the database does not support it."""
+    instance = get_instance(hass)
+    if (
+        bulk_insert_states
+        and not instance.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+    ):
+        pytest.skip("Database does not support executemany with RETURNING")
+    instance.bulk_insert_states = bulk_insert_states
+    return instance
+
+
+@pytest.mark.parametrize("bulk_insert_states", [True, False])
 async def test_saving_state_with_exception(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
     setup_recorder: None,
+    bulk_insert_states: bool,
 ) -> None:
     """Test saving and restoring a state."""
     entity_id = "test.recorder"
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
+    instance = _set_bulk_insert_states(hass, bulk_insert_states)
+
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
+        for obj in instance.event_session:
             if isinstance(obj, States):
                 raise OperationalError(
                     "insert the state", "fake params", "forced to fail"
                 )
 
-    with (
-        patch("time.sleep"),
-        patch.object(
-            get_instance(hass).event_session,
+    if bulk_insert_states:
+        failing_insert = patch.object(
+            instance.states_manager,
+            "insert_pending",
+            side_effect=OperationalError(
+                "insert the state", "fake params", "forced to fail"
+            ),
+        )
+    else:
+        failing_insert = patch.object(
+            instance.event_session,
             "flush",
             side_effect=_throw_if_state_in_session,
-        ),
-    ):
+        )
+
+    with patch("time.sleep"), failing_insert:
         hass.states.async_set(entity_id, "fail", attributes)
         await async_wait_recording_done(hass)
 
@@ -427,31 +454,43 @@ async def test_saving_state_with_exception(
     assert "Error saving events" not in caplog.text
 
 
+@pytest.mark.parametrize("bulk_insert_states", [True, False])
 async def test_saving_state_with_sqlalchemy_exception(
     hass: HomeAssistant,
     caplog: pytest.LogCaptureFixture,
     setup_recorder: None,
+    bulk_insert_states: bool,
 ) -> None:
     """Test saving state when there is an SQLAlchemyError."""
     entity_id = "test.recorder"
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
+    instance = _set_bulk_insert_states(hass, bulk_insert_states)
+
     def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
+        for obj in instance.event_session:
             if isinstance(obj, States):
                 raise SQLAlchemyError(
                     "insert the state", "fake params", "forced to fail"
                 )
 
-    with (
-        patch("time.sleep"),
-        patch.object(
-            get_instance(hass).event_session,
+    if bulk_insert_states:
+        failing_insert = patch.object(
+            instance.states_manager,
+            "insert_pending",
+            side_effect=SQLAlchemyError(
+                "insert the state", "fake params", "forced to fail"
+            ),
+        )
+    else:
+        failing_insert = patch.object(
+            instance.event_session,
             "flush",
             side_effect=_throw_if_state_in_session,
-        ),
-    ):
+        )
+
+    with patch("time.sleep"), failing_insert:
         hass.states.async_set(entity_id, "fail", attributes)
         await async_wait_recording_done(hass)
 
@@ -1468,6 +1507,150 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("bulk_insert_states", [True, False])
+async def test_saving_state_chains_in_one_commit(
+    hass: HomeAssistant, setup_recorder: None, bulk_insert_states: bool
+) -> None:
+    """Test states of the same entity are linked when saved in one commit."""
+    _set_bulk_insert_states(hass, bulk_insert_states)
+
+    hass.states.async_set("test.one", "s1", {"attr": 1})
+    hass.states.async_set("test.one", "s2", {"attr": 1})
+    hass.states.async_set("test.two", "s3", {"attr": 2})
+    hass.states.async_set("test.one", "s4", {"attr": 2})
+    hass.states.async_remove("test.two")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 5
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s3"].entity_id == "test.two"
+        assert states_by_state["s3"].old_state_id is None
+        assert states_by_state[None].entity_id == "test.two"
+        assert states_by_state[None].old_state_id == states_by_state["s3"].state_id
+        assert (
+            states_by_state["s1"].attributes_id == states_by_state["s2"].attributes_id
+        )
+        assert (
+            states_by_state["s3"].attributes_id == states_by_state["s4"].attributes_id
+        )
+
+
+@pytest.mark.parametrize("bulk_insert_states", [True, False])
+async def test_saving_state_chain_with_unserializable_state(
+    hass: HomeAssistant, setup_recorder: None, bulk_insert_states: bool
+) -> None:
+    """Test the old state is linked when the previous state was not serializable."""
+    _set_bulk_insert_states(hass, bulk_insert_states)
+
+    hass.states.async_set("test.one", "s1", {})
+    hass.states.async_set("test.one", "s2", {"fail": CannotSerializeMe()})
+    hass.states.async_set("test.one", "s3", {})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(session.query(States.state_id, States.old_state_id, States.state))
+        assert len(states) == 3
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s3"].old_state_id == states_by_state["s2"].state_id
+
+
+@pytest.mark.parametrize("bulk_insert_states", [True, False])
+async def test_saving_states_when_commit_is_retried(
+    hass: HomeAssistant, setup_recorder: None, bulk_insert_states: bool
+) -> None:
+    """Test states are saved once when the commit fails and is retried."""
+    instance = _set_bulk_insert_states(hass, bulk_insert_states)
+    session = instance.event_session
+    original_commit = session.commit
+    commits = 0
+
+    def _fail_first_commit() -> None:
+        nonlocal commits
+        commits += 1
+        if commits == 1:
+            raise OperationalError("commit", "fake params", "database is locked")
+        original_commit()
+
+    with (
+        patch("time.sleep"),
+        patch.object(session, "commit", side_effect=_fail_first_commit),
+    ):
+        hass.states.async_set("test.one", "s1", {"attr": 1})
+        hass.states.async_set("test.one", "s2", {"attr": 2})
+        hass.states.async_set("test.two", "s3", {"attr": 1})
+        await async_wait_recording_done(hass)
+
+    assert commits > 1
+
+    hass.states.async_set("test.one", "s4", {"attr": 1})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id, States.state_id, States.old_state_id, States.state
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 4
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s3"].entity_id == "test.two"
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
+
+
+async def test_saving_states_when_bulk_insert_is_retried(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test states are not inserted twice when a later generation fails."""
+    instance = _set_bulk_insert_states(hass, True)
+    session = instance.event_session
+    original_execute = session.execute
+    inserts = 0
+
+    def _fail_second_insert(statement: Any, *args: Any, **kwargs: Any) -> Any:
+        nonlocal inserts
+        if statement is states_table_manager._INSERT_STATES_RETURNING_IDS:
+            inserts += 1
+            if inserts == 2:
+                raise OperationalError("insert", "fake params", "database is locked")
+        return original_execute(statement, *args, **kwargs)
+
+    with (
+        patch("time.sleep"),
+        patch.object(session, "execute", side_effect=_fail_second_insert),
+    ):
+        hass.states.async_set("test.one", "s1", {"attr": 1})
+        hass.states.async_set("test.two", "s2", {"attr": 1})
+        hass.states.async_set("test.one", "s3", {"attr": 1})
+        await async_wait_recording_done(hass)
+
+    assert inserts > 2
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(session.query(States.state_id, States.old_state_id, States.state))
+        assert len(states) == 3
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -16,10 +16,13 @@ from homeassistant.components.recorder.models import (
     LazyState,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
+    row_to_compressed_state,
+    row_to_compressed_state_with_json_attributes,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 import homeassistant.core as ha
 from homeassistant.exceptions import InvalidEntityFormatError
+from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
@@ -315,6 +318,34 @@ async def test_lazy_state_can_decode_attributes(
     }
 
 
+async def test_row_to_compressed_state_with_json_attributes() -> None:
+    """Test the attributes are encoded without decoding them."""
+    row = PropertyMock(
+        attributes='{"shared":true,"friendly_name":"Kitchen"}',
+        last_changed_ts=1.0,
+    )
+    attr_cache: dict = {}
+    comp_state = row_to_compressed_state_with_json_attributes(
+        row, attr_cache, None, "sensor.kitchen", "on", 2.0, False
+    )
+    assert list(attr_cache) == [row.attributes]
+    assert json_bytes(comp_state) == json_bytes(
+        row_to_compressed_state(row, {}, None, "sensor.kitchen", "on", 2.0, False)
+    )
+    assert json_loads(json_bytes(comp_state)) == {
+        "s": "on",
+        "a": {"shared": True, "friendly_name": "Kitchen"},
+        "lu": 2.0,
+        "lc": 1.0,
+    }
+
+    row = PropertyMock(attributes=None, last_changed_ts=None)
+    comp_state = row_to_compressed_state_with_json_attributes(
+        row, attr_cache, None, "sensor.kitchen", "on", 2.0, False
+    )
+    assert json_loads(json_bytes(comp_state)) == {"s": "on", "a": {}, "lu": 2.0}
+
+
 async def test_lazy_state_handles_different_last_updated_and_last_changed(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
@@ -0,0 +1,104 @@
+"""The tests for the recorder partitioned tables."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from homeassistant.components.recorder import partition
+from homeassistant.components.recorder.util import get_instance
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from tests.typing import RecorderInstanceGenerator
+
+
+def test_partitioned_tables_ddl() -> None:
+    """Test the DDL of the partitioned tables."""
+    ddl = partition.partitioned_tables_ddl(postgresql.dialect())
+    create_states = next(
+        statement for statement in ddl if statement.startswith("CREATE TABLE states ")
+    )
+    assert "state_id BIGSERIAL" in create_states
+    assert "PRIMARY KEY (state_id, last_updated_ts)" in create_states
+    assert "REFERENCES state_attributes" in create_states
+    assert "REFERENCES states_meta" in create_states
+    # Foreign keys can not reference a partitioned table
+    assert "REFERENCES states " not in create_states
+    assert create_states.endswith("PARTITION BY RANGE (last_updated_ts)")
+
+    create_events = next(
+        statement for statement in ddl if statement.startswith("CREATE TABLE events ")
+    )
+    assert "PRIMARY KEY (event_id, time_fired_ts)" in create_events
+    assert create_events.endswith("PARTITION BY RANGE (time_fired_ts)")
+
+    assert (
+        "CREATE INDEX ix_states_metadata_id_last_updated_ts ON states"
+        " (metadata_id, last_updated_ts)"
+    ) in ddl
+    assert (
+        "CREATE UNIQUE INDEX ix_statistics_short_term_statistic_id_start_ts"
+        " ON statistics_short_term (metadata_id, start_ts)"
+    ) in ddl
+    for table_name in partition.PARTITIONED_TABLES:
+        assert (
+            f"CREATE TABLE {table_name}_default PARTITION OF {table_name} DEFAULT"
+        ) in ddl
+
+
+def test_create_partitions() -> None:
+    """Test only the missing partitions are created."""
+    connection = MagicMock()
+    connection.execute.return_value = [
+        ("states_p20241030",),
+        ("states_p20241031",),
+        ("states_default",),
+    ]
+    partition.create_partitions(
+        connection, datetime(2024, 10, 30, 23, 30, tzinfo=dt_util.UTC)
+    )
+    created = [
+        str(call.args[0])
+        for call in connection.execute.call_args_list
+        if str(call.args[0]).startswith("CREATE TABLE")
+    ]
+    assert len(created) == 3 * (partition.PARTITION_DAYS_AHEAD + 1) - 2
+    assert "CREATE TABLE states_p20241030 PARTITION OF states" not in " ".join(created)
+    assert (
+        "CREATE TABLE states_p20241101 PARTITION OF states"
+        " FOR VALUES FROM (1730419200.0) TO (1730505600.0)"
+    ) in created
+    assert (
+        "CREATE TABLE events_p20241030 PARTITION OF events"
+        " FOR VALUES FROM (1730246400.0) TO (1730332800.0)"
+    ) in created
+
+
+def test_find_expired_partitions() -> None:
+    """Test finding the partitions which end before the purge time."""
+    session = MagicMock()
+    session.execute.return_value = [
+        ("events_p20241029",),
+        ("events_p20241027",),
+        ("events_p20241028",),
+        ("events_default",),
+        ("events_pbad",),
+    ]
+    assert partition.find_expired_partitions(
+        session, "events", datetime(2024, 10, 29, 12, tzinfo=dt_util.UTC)
+    ) == ["events_p20241027", "events_p20241028"]
+
+
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+async def test_partitioning_requires_postgresql(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test partitioned tables are not created with other databases."""
+    await async_setup_recorder_instance(hass, {"db_partitioning": True})
+    assert get_instance(hass).partitioned is False
+    assert "Partitioned tables are only supported with PostgreSQL" in caplog.text
@@ -4,6 +4,7 @@ from collections.abc import Generator
 from datetime import datetime, timedelta
 import json
 import sqlite3
+from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -45,6 +46,7 @@ from .common import (
     convert_pending_states_to_meta,
 )
 
+from tests.common import async_fire_time_changed
 from tests.typing import RecorderInstanceGenerator
 
 TEST_EVENT_TYPES = (
@@ -110,6 +112,57 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
             assert state_attributes.count() == 1
 
 
+async def test_purge_task_time_budget_and_checkpoint(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_storage: dict[str, Any]
+) -> None:
+    """Test a purge task stops at its time budget and resumes from the checkpoint."""
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 10),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 10),
+        patch("homeassistant.components.recorder.tasks.PURGE_TIME_BUDGET", 0),
+        patch.object(recorder_mock, "queue_task") as queue_task,
+    ):
+        PurgeTask(purge_before, repack=False, apply_filter=False).run(recorder_mock)
+    await hass.async_block_till_done()
+
+    # Only one batch was purged before the time budget ran out
+    queue_task.assert_called_once_with(
+        PurgeTask(purge_before, repack=False, apply_filter=False)
+    )
+    progress = recorder_mock.purge_progress
+    assert progress is not None
+    assert progress.states_purged == 10
+    assert progress.events_purged == 0
+    assert not progress.finished
+    assert progress.elapsed > 0
+    assert progress.rows_per_second == 10 / progress.elapsed
+
+    await hass.async_block_till_done()
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+    assert hass_storage["recorder.purge_checkpoint"]["data"] == progress.as_dict()
+
+    # Resume the purge from the saved checkpoint as done after a restart
+    recorder_mock.purge_progress = None
+    await recorder_mock.async_load_purge_checkpoint()
+    assert recorder_mock.purge_progress == progress
+    recorder_mock._async_resume_purge()
+    await async_wait_purge_done(hass)
+    await hass.async_block_till_done()
+
+    progress = recorder_mock.purge_progress
+    assert progress.states_purged == 48
+    assert progress.finished
+    assert "recorder.purge_checkpoint" not in hass_storage
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 24
+
+
 async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old states."""
     await _add_test_states(hass)
@@ -0,0 +1,74 @@
+"""The tests for the recorder recent history."""
+
+from homeassistant.components.recorder.recent_history import RecentHistory
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, State
+import homeassistant.util.dt as dt_util
+
+
+def _state_changed_event(
+    entity_id: str, state: str | None, last_updated_ts: float
+) -> Event:
+    """Return a state_changed event."""
+    new_state = None
+    if state is not None:
+        last_updated = dt_util.utc_from_timestamp(last_updated_ts)
+        new_state = State(
+            entity_id, state, last_updated=last_updated, last_changed=last_updated
+        )
+    return Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": entity_id, "old_state": None, "new_state": new_state},
+        time_fired_timestamp=last_updated_ts,
+    )
+
+
+def test_recent_history_covers_start_time() -> None:
+    """Test states are only returned when they cover the start time."""
+    recent_history = RecentHistory(10)
+    recent_history.async_add(_state_changed_event("sensor.a", "1", 10))
+    recent_history.async_add(_state_changed_event("sensor.b", "1", 20))
+    recent_history.async_add(_state_changed_event("sensor.a", "2", 30))
+    recent_history.async_add(_state_changed_event("sensor.a", None, 40))
+
+    states = recent_history.async_get_states(["sensor.a"], 15)
+    assert states is not None
+    assert [
+        (recent_state.last_updated_ts, recent_state.state and recent_state.state.state)
+        for recent_state in states["sensor.a"]
+    ] == [(10, "1"), (30, "2"), (40, None)]
+    assert recent_history.async_get_states(["sensor.a", "sensor.b"], 15) is None
+    assert recent_history.async_get_states(["sensor.a", "sensor.c"], 50) is None
+    assert recent_history.async_get_states(["sensor.a", "sensor.b"], 25)
+    assert recent_history.hits == 2
+    assert recent_history.misses == 2
+    assert recent_history.states_count == 4
+
+    recent_history.async_clear()
+    assert recent_history.states_count == 0
+    assert recent_history.async_get_states(["sensor.a"], 50) is None
+
+
+def test_recent_history_drops_oldest_states() -> None:
+    """Test the oldest states are dropped but the current state is kept."""
+    recent_history = RecentHistory(3)
+    recent_history.async_add(_state_changed_event("sensor.quiet", "1", 1))
+    for last_updated_ts in range(2, 10):
+        recent_history.async_add(
+            _state_changed_event("sensor.busy", str(last_updated_ts), last_updated_ts)
+        )
+
+    states = recent_history.async_get_states(["sensor.quiet", "sensor.busy"], 7.5)
+    assert states is not None
+    assert [state.last_updated_ts for state in states["sensor.quiet"]] == [1]
+    assert [state.last_updated_ts for state in states["sensor.busy"]] == [7, 8, 9]
+    assert recent_history.async_get_states(["sensor.busy"], 7) is None
+    assert recent_history.states_count == 4
+
+
+def test_recent_history_disabled() -> None:
+    """Test nothing is buffered when max_states is zero."""
+    recent_history = RecentHistory(0)
+    recent_history.async_add(_state_changed_event("sensor.a", "1", 10))
+    assert recent_history.states_count == 0
+    assert recent_history.async_get_states(["sensor.a"], 20) is None
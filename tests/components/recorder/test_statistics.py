@@ -1,21 +1,30 @@
 """The tests for sensor recorder platform."""
 
-from datetime import timedelta
-from typing import Any
+from datetime import datetime, timedelta
+from typing import Any, Literal
 from unittest.mock import ANY, Mock, patch
 
 import pytest
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+    StatisticsWeekly,
+)
 from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMetaData,
     datetime_to_timestamp_or_none,
     process_timestamp,
 )
 from homeassistant.components.recorder.statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
+    STATISTICS_ROLLUPS,
     PlatformCompiledStatistics,
     _generate_max_mean_min_statistic_in_sub_period_stmt,
     _generate_statistics_at_time_stmt,
@@ -35,6 +44,7 @@ from homeassistant.components.recorder.statistics import (
 from homeassistant.components.recorder.table_managers.statistics_meta import (
     _generate_get_metadata_stmt,
 )
+from homeassistant.components.recorder.tasks import RollUpStatisticsTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.sensor import UNIT_CONVERTERS
 from homeassistant.core import HomeAssistant
@@ -352,6 +362,93 @@ def mock_from_stats():
         yield
 
 
+@pytest.mark.parametrize(
+    ("reset_accumulator_at", "skip_period_at", "summarized_from_database"),
+    [(None, None, False), (30, None, False), (None, 25, True)],
+)
+async def test_compile_hourly_statistics_from_accumulator(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    reset_accumulator_at: int | None,
+    skip_period_at: int | None,
+    summarized_from_database: bool,
+) -> None:
+    """Test hourly statistics are summarized from the 5-minute statistics.
+
+    The 5-minute statistics are reloaded from the database if the
+    accumulator was reset during the hour, and the hourly statistics
+    are summarized by the database if a 5-minute period is missing.
+    """
+    zero = get_start_time(dt_util.utcnow()).replace(minute=0) + timedelta(hours=1)
+    metadata: StatisticMetaData = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": None,
+        "source": "recorder",
+        "statistic_id": "sensor.test",
+        "unit_of_measurement": "kWh",
+    }
+
+    def _mock_compile_statistics(
+        hass: HomeAssistant, session: Session, start: datetime, end: datetime
+    ) -> PlatformCompiledStatistics:
+        minute = start.minute
+        current_metadata = get_metadata_with_session(
+            recorder.get_instance(hass), session, statistic_ids={"sensor.test"}
+        )
+        if minute == 20:
+            # No statistics for this period
+            return PlatformCompiledStatistics([], current_metadata)
+        stat: StatisticData = {
+            "start": start,
+            "mean": minute,
+            "min": minute - 1,
+            "max": minute + 1,
+            "state": minute,
+            "sum": minute * 2,
+        }
+        return PlatformCompiledStatistics(
+            [{"meta": metadata, "stat": stat}], current_metadata
+        )
+
+    await _setup_mock_domain(
+        hass, Mock(compile_statistics=Mock(wraps=_mock_compile_statistics))
+    )
+    await async_recorder_block_till_done(hass)
+
+    with patch.object(
+        statistics,
+        "_compile_hourly_statistics_summary_mean_stmt",
+        wraps=statistics._compile_hourly_statistics_summary_mean_stmt,
+    ) as summary_mean_stmt:
+        for minute in range(0, 60, 5):
+            if minute == skip_period_at:
+                continue
+            if minute == reset_accumulator_at:
+                statistics.get_hourly_statistics_accumulator(hass).reset()
+            do_adhoc_statistics(hass, start=zero + timedelta(minutes=minute))
+            await async_wait_recording_done(hass)
+
+    assert summary_mean_stmt.called is summarized_from_database
+    minutes = [
+        minute for minute in range(0, 60, 5) if minute not in (20, skip_period_at)
+    ]
+    assert statistics_during_period(hass, zero, statistic_ids={"sensor.test"}) == {
+        "sensor.test": [
+            {
+                "start": zero.timestamp(),
+                "end": (zero + timedelta(hours=1)).timestamp(),
+                "mean": pytest.approx(sum(minutes) / len(minutes)),
+                "min": pytest.approx(-1.0),
+                "max": pytest.approx(56.0),
+                "last_reset": None,
+                "state": pytest.approx(55.0),
+                "sum": pytest.approx(110.0),
+            }
+        ]
+    }
+
+
 async def test_compile_periodic_statistics_exception(
     hass: HomeAssistant, setup_recorder: None, mock_sensor_statistics, mock_from_stats
 ) -> None:
@@ -1844,6 +1941,154 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-01-15 12:00:00+00:00")
+async def test_statistics_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone,
+) -> None:
+    """Test daily, weekly and monthly statistics are read from rollups."""
+    await hass.config.async_set_time_zone(timezone)
+    await async_wait_recording_done(hass)
+    instance = recorder.get_instance(hass)
+
+    # Two months of hourly statistics, including the end of daylight saving
+    # time in Europe/Vienna
+    start = dt_util.as_utc(dt_util.parse_datetime("2021-10-01 00:00:00"))
+    end = dt_util.as_utc(dt_util.parse_datetime("2021-12-01 00:00:00"))
+    hours = int((end - start) / timedelta(hours=1))
+    sum_metadata: StatisticMetaData = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    sum_statistics: list[StatisticData] = [
+        {
+            "start": start + timedelta(hours=hour),
+            "last_reset": None,
+            "state": hour % 100,
+            "sum": hour,
+        }
+        for hour in range(hours)
+    ]
+    mean_metadata: StatisticMetaData = {
+        "has_mean": True,
+        "has_sum": False,
+        "name": "Temperature",
+        "source": "test",
+        "statistic_id": "test:temperature",
+        "unit_of_measurement": "°C",
+    }
+    mean_statistics: list[StatisticData] = [
+        {
+            "start": start + timedelta(hours=hour),
+            "mean": hour % 7,
+            "min": hour % 7 - 1,
+            "max": hour % 11,
+        }
+        for hour in range(hours)
+    ]
+    async_add_external_statistics(hass, sum_metadata, sum_statistics)
+    async_add_external_statistics(hass, mean_metadata, mean_statistics)
+    await async_wait_recording_done(hass)
+
+    statistic_ids = {"test:total_energy_import", "test:temperature"}
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]] = {
+        "last_reset",
+        "max",
+        "mean",
+        "min",
+        "state",
+        "sum",
+    }
+
+    def assert_reduced_from_hourly_statistics() -> None:
+        for period, rollup in STATISTICS_ROLLUPS.items():
+            hourly_stats = statistics_during_period(
+                hass, start, end, statistic_ids, "hour"
+            )
+            stats = statistics_during_period(hass, start, end, statistic_ids, period)
+            assert stats == rollup.reduce(hourly_stats, types)
+            stats = statistics_during_period(
+                hass, start, None, {"test:total_energy_import"}, period, None, {"sum"}
+            )
+            assert stats == {
+                "test:total_energy_import": [
+                    {key: row[key] for key in ("start", "end", "sum")}
+                    for row in rollup.reduce(hourly_stats, types)[
+                        "test:total_energy_import"
+                    ]
+                ]
+            }
+
+    def rollup_counts() -> tuple[int, int, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return (
+                session.query(StatisticsDaily).count(),
+                session.query(StatisticsWeekly).count(),
+                session.query(StatisticsMonthly).count(),
+            )
+
+    assert rollup_counts() == (0, 0, 0)
+    assert_reduced_from_hourly_statistics()
+
+    instance.queue_task(RollUpStatisticsTask())
+    await async_wait_recording_done(hass)
+    daily, weekly, monthly = rollup_counts()
+    assert daily == 2 * 61
+    assert weekly >= 2 * 9
+    assert monthly == 2 * 2
+
+    # Hourly statistics are only read after the rollups
+    with patch.object(
+        statistics,
+        "_generate_statistics_during_period_stmt",
+        wraps=_generate_statistics_during_period_stmt,
+    ) as generate_stmt_mock:
+        for period in STATISTICS_ROLLUPS:
+            statistics_during_period(hass, start, end, statistic_ids, period)
+    hourly_start_times = [
+        call.args[0]
+        for call in generate_stmt_mock.mock_calls
+        if call.args[3] is statistics.Statistics
+    ]
+    assert hourly_start_times
+    assert all(start_time >= end for start_time in hourly_start_times)
+    assert_reduced_from_hourly_statistics()
+
+    # Adjusting the sum deletes the rollups which include the adjustment
+    adjust_start = dt_util.as_utc(dt_util.parse_datetime("2021-11-15 10:00:00"))
+    instance.async_adjust_statistics(
+        "test:total_energy_import", adjust_start, 100, "kWh"
+    )
+    await async_wait_recording_done(hass)
+    assert rollup_counts()[0] == daily - 16
+    assert rollup_counts()[2] == monthly - 1
+    assert_reduced_from_hourly_statistics()
+
+    instance.queue_task(RollUpStatisticsTask())
+    await async_wait_recording_done(hass)
+    assert rollup_counts() == (daily, weekly, monthly)
+    assert_reduced_from_hourly_statistics()
+
+    # Rollups in another time zone are not used and are rolled up again
+    await hass.config.async_set_time_zone("Asia/Kolkata")
+    assert_reduced_from_hourly_statistics()
+    instance.queue_task(RollUpStatisticsTask())
+    await async_wait_recording_done(hass)
+    assert_reduced_from_hourly_statistics()
+    with session_scope(hass=hass, read_only=True) as session:
+        _, day_start_end = STATISTICS_ROLLUPS["day"].period_factory()
+        assert all(
+            day_start_end(start_ts)[0] == start_ts
+            for (start_ts,) in session.query(StatisticsDaily.start_ts)
+        )
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
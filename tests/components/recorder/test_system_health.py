@@ -4,10 +4,15 @@ from unittest.mock import ANY, Mock, patch
 
 import pytest
 
-from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.components.recorder import (
+    CONF_RECENT_HISTORY_MAX_STATES,
+    Recorder,
+    get_instance,
+)
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 from .common import async_wait_recording_done
 
@@ -35,6 +40,7 @@ async def test_recorder_system_health(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "recent_history_states": ANY,
     }
 
 
@@ -64,6 +70,7 @@ async def test_recorder_system_health_alternate_dbms(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "recent_history_states": ANY,
     }
 
 
@@ -99,6 +106,7 @@ async def test_recorder_system_health_db_url_missing_host(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "recent_history_states": ANY,
     }
 
 
@@ -127,4 +135,39 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "recent_history_states": ANY,
     }
+
+
+async def test_recorder_system_health_recent_history(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health reports the recent history."""
+    assert await async_setup_component(hass, "system_health", {})
+    hass.states.async_set("sensor.test", "1")
+    hass.states.async_set("sensor.test", "2")
+    await async_wait_recording_done(hass)
+
+    instance = get_instance(hass)
+    info = await get_system_health_info(hass, "recorder")
+    assert info["recent_history_states"] == f"2/{instance.recent_history.max_states}"
+    assert "recent_history_hit_ratio" not in info
+
+    recent_history = instance.recent_history
+    recent_history.async_get_states(["sensor.test"], dt_util.utcnow().timestamp())
+    recent_history.async_get_states(["sensor.test"], 0)
+    info = await get_system_health_info(hass, "recorder")
+    assert info["recent_history_hit_ratio"] == "50.0%"
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_RECENT_HISTORY_MAX_STATES: 0}])
+async def test_recorder_system_health_recent_history_disabled(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test recorder system health without the recent history."""
+    assert await async_setup_component(hass, "system_health", {})
+    hass.states.async_set("sensor.test", "1")
+    await async_wait_recording_done(hass)
+
+    info = await get_system_health_info(hass, "recorder")
+    assert "recent_history_states" not in info
@@ -13,6 +13,7 @@ import pytest
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.db_schema import Statistics, StatisticsShortTerm
+from homeassistant.components.recorder.purge import PurgeProgress
 from homeassistant.components.recorder.statistics import (
     async_add_external_statistics,
     get_last_statistics,
@@ -1996,6 +1997,40 @@ async def test_update_statistics_issues(
     assert response["result"] is None
 
 
+async def test_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the progress of the last purge."""
+    client = await hass_ws_client()
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+    purge_before = dt_util.utcnow() - timedelta(days=10)
+    recorder_mock.purge_progress = PurgeProgress(
+        purge_before,
+        repack=False,
+        apply_filter=True,
+        states_purged=150,
+        events_purged=50,
+        elapsed=4.0,
+    )
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "purge_before": purge_before.isoformat(),
+        "repack": False,
+        "apply_filter": True,
+        "states_purged": 150,
+        "events_purged": 50,
+        "elapsed": 4.0,
+        "finished": False,
+        "rows_per_second": 50.0,
+    }
+
+
 async def test_clear_statistics(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 from typing import Any, cast
 from unittest.mock import patch
+import zlib
 
 from aiohttp import WSMsgType, WSServerHandshakeError, web
 import pytest
@@ -15,10 +16,13 @@ from homeassistant.components.websocket_api import (
     websocket_command,
 )
 from homeassistant.components.websocket_api.connection import ActiveConnection
+from homeassistant.components.websocket_api.messages import cached_state_diff_message
+from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.util.dt import utcnow
+from homeassistant.util.json import json_loads
 
-from tests.common import async_fire_time_changed
+from tests.common import async_capture_events, async_fire_time_changed
 from tests.typing import MockHAClientWebSocket, WebSocketGenerator
 
 
@@ -255,6 +259,52 @@ async def test_pending_msg_peak(
     assert "overload" in caplog.text
 
 
+async def test_pending_state_diffs_coalesced(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test pending state diffs are merged instead of overflowing the queue."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    instance._coalesce_queue_size = 4
+
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    for idx in range(30):
+        hass.states.async_set("light.kitchen", str(idx), {"brightness": idx})
+    await hass.async_block_till_done()
+
+    with (
+        patch("homeassistant.components.websocket_api.http.MAX_PENDING_MSG", 8),
+        patch("homeassistant.components.websocket_api.http.PENDING_MSG_COALESCE", 4),
+    ):
+        for event in events:
+            instance._send_message(cached_state_diff_message(b"5", event))
+        pending_messages = len(instance._message_queue)
+        assert pending_messages < 4
+        assert instance._coalesced_message_count > 0
+
+    messages = [
+        json_loads(msg.data)
+        for msg in [await websocket_client.receive() for _ in range(pending_messages)]
+    ]
+    assert messages[-1]["event"]["c"]["light.kitchen"]["+"]["s"] == "29"
+    assert "Client unable to keep up with pending messages" not in caplog.text
+
+
 async def test_pending_msg_peak_recovery(
     hass: HomeAssistant,
     mock_low_peak,
@@ -451,6 +501,50 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_enable_compressed_messages(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test enabling compressed messages."""
+    websocket_client = await hass_ws_client(hass)
+
+    async def receive_compressed(count: int) -> list[dict[str, Any]]:
+        received: list[dict[str, Any]] = []
+        while len(received) < count:
+            msg = await websocket_client.receive()
+            assert msg.type is WSMsgType.BINARY
+            data = json_loads(zlib.decompress(msg.data, -zlib.MAX_WBITS))
+            received.extend(data if isinstance(data, list) else [data])
+        return received
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {
+                const.FEATURE_COALESCE_MESSAGES: 1,
+                const.FEATURE_COMPRESSED_MESSAGES: 1,
+            },
+        }
+    )
+    (msg,) = await receive_compressed(1)
+    assert msg["id"] == 1
+    assert msg["success"] is True
+
+    await websocket_client.send_json({"id": 2, "type": "subscribe_entities"})
+    result, event = await receive_compressed(2)
+    assert result["id"] == 2
+    assert result["type"] == "result"
+    assert event == {"id": 2, "type": "event", "event": {"a": {}}}
+
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.bedroom", "off")
+    await hass.async_block_till_done()
+    assert [list(msg["event"]["a"]) for msg in await receive_compressed(2)] == [
+        ["light.kitchen"],
+        ["light.bedroom"],
+    ]
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
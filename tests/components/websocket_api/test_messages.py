@@ -1,15 +1,23 @@
 """Test Websocket API messages module."""
 
+from unittest.mock import ANY
+import zlib
+
 import pytest
 
 from homeassistant.components.websocket_api.messages import (
+    MessageDeflater,
+    _deflate_partial_message as lru_deflate_cache,
     _partial_cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    cached_state_diff_message,
+    coalesce_state_diff_messages,
     message_to_json_bytes,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -83,6 +91,88 @@ async def test_cached_event_message_with_different_idens(hass: HomeAssistant) ->
     assert cache_info.currsize == 1
 
 
+async def test_message_deflater(hass: HomeAssistant) -> None:
+    """Test messages are compressed with shared partial messages."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on", {"friendly_name": "Window"})
+    await hass.async_block_till_done()
+    lru_deflate_cache.cache_clear()
+
+    deflaters = [MessageDeflater() for _ in range(3)]
+    messages = [
+        cached_state_diff_message(str(iden).encode(), events[0]) for iden in range(3)
+    ]
+    for deflater, message in zip(deflaters, messages, strict=True):
+        assert zlib.decompress(deflater.deflate((message,), False), -15) == message
+
+    cache_info = lru_deflate_cache.cache_info()
+    assert cache_info.hits == 2
+    assert cache_info.misses == 1
+
+    coalesced = [b'{"id":1}', messages[0], messages[1], b'{"id":2}']
+    assert zlib.decompress(deflaters[0].deflate(coalesced, True), -15) == b"".join(
+        (b"[", b",".join(coalesced), b"]")
+    )
+    assert (
+        zlib.decompress(deflaters[0].deflate((b'{"id":3}',), False), -15) == b'{"id":3}'
+    )
+
+
+async def test_coalesce_state_diff_messages(hass: HomeAssistant) -> None:
+    """Test the pending state diffs of an entity are merged."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    hass.states.async_set("light.window", "on", {"brightness": 100})
+    hass.states.async_set("light.window", "on", {"brightness": 150, "effect": "x"})
+    hass.states.async_set("light.door", "on")
+    hass.states.async_set("light.window", "off", {"effect": "x"})
+    hass.states.async_set("light.temporary", "on")
+    hass.states.async_remove("light.temporary")
+    await hass.async_block_till_done()
+
+    messages = [cached_state_diff_message(b"5", event) for event in events]
+    other_subscription = cached_state_diff_message(b"6", events[3])
+    coalesced = coalesce_state_diff_messages(
+        [*messages[:3], b'{"id":1}', other_subscription, *messages[3:]]
+    )
+    assert [json_loads(bytes(message)) for message in coalesced] == [
+        {
+            "id": 5,
+            "type": "event",
+            "event": {"a": {"light.door": {"s": "on", "a": {}, "c": ANY, "lc": ANY}}},
+        },
+        {"id": 1},
+        {
+            "id": 6,
+            "type": "event",
+            "event": {
+                "c": {
+                    "light.window": {
+                        "+": {"s": "off", "c": ANY, "lc": ANY},
+                        "-": {"a": ["brightness"]},
+                    }
+                }
+            },
+        },
+        {
+            "id": 5,
+            "type": "event",
+            "event": {
+                "a": {
+                    "light.window": {
+                        "s": "off",
+                        "a": {"effect": "x"},
+                        "c": ANY,
+                        "lc": ANY,
+                    }
+                }
+            },
+        },
+    ]
+
+    # Nothing to merge
+    assert coalesce_state_diff_messages(messages[:3:2]) == messages[:3:2]
+
+
 async def test_state_diff_event(hass: HomeAssistant) -> None:
     """Test building state_diff_message."""
     state_change_events = async_capture_events(hass, EVENT_STATE_CHANGED)
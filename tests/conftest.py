@@ -324,6 +324,33 @@ def skip_stop_scripts(
         yield
 
 
+@pytest.fixture
+def load_template_bytecode_cache() -> bool:
+    """Add ability to load and save the template bytecode cache.
+
+    The cache is saved in the .storage directory of the config dir.
+
+    Parametrize to True to load the cache.
+    @pytest.mark.parametrize("load_template_bytecode_cache", [True])
+    """
+    return False
+
+
+@pytest.fixture(autouse=True)
+def skip_template_bytecode_cache(
+    load_template_bytecode_cache: bool,
+) -> Generator[None]:
+    """Add ability to bypass loading the template bytecode cache."""
+    if load_template_bytecode_cache:
+        yield
+        return
+    with patch(
+        "homeassistant.helpers.template.async_load_bytecode_cache",
+        AsyncMock(),
+    ):
+        yield
+
+
 @contextmanager
 def long_repr_strings() -> Generator[None]:
     """Increase reprlib maxstring and maxother to 300."""
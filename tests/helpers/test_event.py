@@ -13,7 +13,7 @@ from freezegun.api import FrozenDateTimeFactory
 import jinja2
 import pytest
 
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import (
     Event,
@@ -444,6 +444,57 @@ async def test_async_track_state_change_filtered(hass: HomeAssistant) -> None:
     track_throws.async_remove()
 
 
+async def test_async_track_state_change_filtered_shares_listener(
+    hass: HomeAssistant,
+) -> None:
+    """Test domain and all states trackers share one state_changed listener."""
+    hass.states.async_set("sensor.one", "1")
+    await hass.async_block_till_done()
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    domain_calls: list[str] = []
+    all_calls: list[str] = []
+
+    @ha.callback
+    def domain_callback(event: Event[EventStateChangedData]) -> None:
+        domain_calls.append(event.data["entity_id"])
+
+    @ha.callback
+    def all_callback(event: Event[EventStateChangedData]) -> None:
+        all_calls.append(event.data["entity_id"])
+
+    trackers = [
+        async_track_state_change_filtered(
+            hass,
+            TrackStates(False, {"sensor.one", "light.bowl"}, {"sensor"}),
+            domain_callback,
+        )
+        for _ in range(10)
+    ]
+    trackers.extend(
+        async_track_state_change_filtered(
+            hass, TrackStates(True, set(), set()), all_callback
+        )
+        for _ in range(10)
+    )
+    # One listener routes domains and all states and one routes entity ids
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 2
+
+    hass.states.async_set("sensor.one", "2")
+    hass.states.async_set("sensor.two", "1")
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.kitchen", "on")
+    await hass.async_block_till_done()
+    assert (
+        domain_calls == ["sensor.one"] * 10 + ["sensor.two"] * 10 + ["light.bowl"] * 10
+    )
+    assert len(all_calls) == 40
+
+    for tracker in trackers:
+        tracker.async_remove()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+
 async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     """Test async_track_state_change_event."""
     single_entity_id_tracker = []
@@ -18,6 +18,7 @@ from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
     STORAGE_KEY,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -135,7 +136,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
-        await hass.async_block_till_done()
+        await hass.async_block_till_done(wait_background_tasks=True)
 
     assert mock_write_data.called
 
@@ -151,7 +152,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
-        await hass.async_block_till_done()
+        await hass.async_block_till_done(wait_background_tasks=True)
 
     assert not mock_write_data.called
 
@@ -184,7 +185,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=10))
-        await hass.async_block_till_done()
+        await hass.async_block_till_done(wait_background_tasks=True)
 
     # Not quite the first interval
     assert not mock_write_data.called
@@ -201,7 +202,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=20))
-        await hass.async_block_till_done()
+        await hass.async_block_till_done(wait_background_tasks=True)
     # Verify still saving
     assert mock_write_data.called
 
@@ -358,6 +359,52 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     assert state1["state"]["state"] == "off"
 
 
+async def test_dump_reuses_unchanged_states(hass: HomeAssistant) -> None:
+    """Test only states written since the last dump are encoded again."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    extra_data = RestoredExtraData({"native_value": 1})
+    entities = []
+    for idx in range(2):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = f"input_boolean.b{idx}"
+        entities.append(entity)
+    await platform.async_add_entities(entities)
+
+    data = async_get(hass)
+    with (
+        patch.object(
+            RestoreEntity, "extra_restore_state_data", extra_data, create=True
+        ),
+        patch.object(extra_data, "as_dict", wraps=extra_data.as_dict) as mock_as_dict,
+        patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data,
+    ):
+        await data.async_dump_states()
+        assert mock_as_dict.call_count == 2
+        first_dump = [
+            json_round_trip(state) for state in mock_write_data.call_args[0][0]
+        ]
+        assert data.last_dump_size > 0
+        assert data.last_dump_duration is not None
+
+        hass.states.async_set("input_boolean.b1", "on")
+        await data.async_dump_states()
+        assert mock_as_dict.call_count == 3
+        second_dump = [
+            json_round_trip(state) for state in mock_write_data.call_args[0][0]
+        ]
+
+    assert [state["extra_data"] for state in second_dump] == [
+        {"native_value": 1},
+        {"native_value": 1},
+    ]
+    assert second_dump[0]["state"] == first_dump[0]["state"]
+    assert second_dump[0]["last_seen"] >= first_dump[0]["last_seen"]
+    assert second_dump[1]["state"]["state"] == "on"
+
+
 async def test_dump_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     states = [
@@ -20,7 +20,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -1046,6 +1046,45 @@ async def test_store_manager_caching(
         await hass.async_stop(force=True)
 
 
+async def test_store_manager_parallel_preload(tmpdir: py.path.local) -> None:
+    """Test store manager preloads the files in parallel jobs."""
+    loop = asyncio.get_running_loop()
+
+    def _setup_mock_storage():
+        config_dir = tmpdir.mkdir("temp_config")
+        tmp_storage = config_dir.mkdir(".storage")
+        for idx in range(10):
+            tmp_storage.join(f"integration{idx}").write_binary(
+                json_bytes({"data": {"idx": idx}, "version": 1})
+            )
+        tmp_storage.join("empty").write_binary(b"")
+        tmp_storage.mkdir("subdir")
+        return config_dir
+
+    config_dir = await loop.run_in_executor(None, _setup_mock_storage)
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store_manager = storage.get_internal_store_manager(hass)
+        await store_manager.async_initialize()
+        keys = [f"integration{idx}" for idx in range(10)]
+        with patch.object(
+            hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+        ) as mock_add_executor_job:
+            await store_manager.async_preload([*keys, "empty", "subdir"])
+        assert mock_add_executor_job.call_count == storage.MAX_LOAD_CONCURRENTLY
+        assert store_manager._preload_times.keys() == set(keys)
+
+        for idx, key in enumerate(keys):
+            assert store_manager.async_fetch(key) == (
+                True,
+                {"data": {"idx": idx}, "version": 1},
+            )
+        # Files which can not be preloaded are loaded by the store
+        assert store_manager.async_fetch("empty") is None
+        assert store_manager.async_fetch("subdir") is None
+        await hass.async_stop(force=True)
+
+
 async def test_store_manager_sub_dirs(tmpdir: py.path.local) -> None:
     """Test store manager ignores subdirs."""
     loop = asyncio.get_running_loop()
@@ -1180,3 +1219,99 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journal(tmpdir: py.path.local, caplog: pytest.LogCaptureFixture) -> None:
+    """Test saving changes to the journal and loading them again."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        item_a = json_fragment(json_bytes({"id": "a", "name": "A"}))
+        item_b = json_fragment(json_bytes({"id": "b", "name": "B"}))
+        await store.async_save({"items": [item_a, item_b], "deleted": []})
+        snapshot = await hass.async_add_executor_job(_read_file, store.path)
+        assert not os.path.exists(store.journal_path)
+
+        item_b = json_fragment(json_bytes({"id": "b", "name": "Renamed"}))
+        item_c = json_fragment(json_bytes({"id": "c", "name": "C"}))
+        await store.async_save({"items": [item_b, item_c], "deleted": [item_a]})
+        # Saving unchanged items does not write
+        await store.async_save({"items": [item_b, item_c], "deleted": [item_a]})
+        assert await hass.async_add_executor_job(_read_file, store.path) == snapshot
+        journal = await hass.async_add_executor_job(_read_file, store.journal_path)
+        assert len(journal.splitlines()) == 1
+
+        expected = {
+            "items": [
+                {"id": "b", "name": "Renamed"},
+                {"id": "c", "name": "C"},
+            ],
+            "deleted": [{"id": "a", "name": "A"}],
+        }
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == expected
+
+        # An incomplete record is ignored
+        await hass.async_add_executor_job(
+            _append_file, store.journal_path, '{"snapshot":'
+        )
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == expected
+        assert "Ignoring incomplete journal record of storage-test" in caplog.text
+
+        # The first save after loading writes a snapshot
+        await store.async_save(expected)
+        assert not os.path.exists(store.journal_path)
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == expected
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compaction(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into the snapshot once it grows too large."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        items = [json_fragment(json_bytes({"id": str(idx)})) for idx in range(10)]
+        await store.async_save({"items": items})
+
+        with patch("homeassistant.helpers.storage.JOURNAL_COMPACT_MIN_SIZE", 100):
+            for idx in range(10):
+                items[idx] = json_fragment(json_bytes({"id": str(idx), "on": True}))
+                await store.async_save({"items": list(items)})
+
+        # Each record is about 70 bytes so the snapshot was rewritten
+        assert store._journal_size <= 100
+        snapshot = await hass.async_add_executor_job(_read_file, store.path)
+        assert '"on":true' in snapshot
+
+        # Records of an older snapshot are ignored
+        await hass.async_add_executor_job(
+            _append_file,
+            store.journal_path,
+            '{"snapshot":"old","data":{"items":{"set":[],"remove":["1"]}}}\n',
+        )
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() == {
+            "items": [{"id": str(idx), "on": True} for idx in range(10)]
+        }
+
+        await store.async_remove()
+        assert not os.path.exists(store.journal_path)
+
+        await hass.async_stop(force=True)
+
+
+def _read_file(path: str) -> str:
+    """Read a file."""
+    with open(path, encoding="utf-8") as fdesc:
+        return fdesc.read()
+
+
+def _append_file(path: str, data: str) -> None:
+    """Append to a file."""
+    with open(path, "a", encoding="utf-8") as fdesc:
+        fdesc.write(data)
@@ -7,12 +7,14 @@ from datetime import datetime, timedelta
 import json
 import logging
 import math
+from pathlib import Path
 import random
 from types import MappingProxyType
 from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -22,6 +24,7 @@ from homeassistant import config_entries
 from homeassistant.components import group
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfLength,
@@ -342,6 +345,50 @@ async def test_import_change(hass: HomeAssistant) -> None:
     assert to_test.async_render() == "macro2 variable2"
 
 
+@pytest.mark.parametrize("load_template_bytecode_cache", [True])
+async def test_bytecode_cache(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test compiled templates are reused after a restart."""
+    hass.config.config_dir = str(tmp_path)
+    storage_path = tmp_path / ".storage"
+    storage_path.mkdir()
+    await template.async_load_bytecode_cache(hass)
+
+    source = "{{ states('sensor.missing') | int(1) + 1 }}"
+    assert template.Template(source, hass).async_render() == 2
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert (storage_path / template.TEMPLATE_BYTECODE_FILE).exists()
+
+    # Simulate a restart
+    for key in (template._ENVIRONMENT, template._ENVIRONMENT_LIMITED):
+        hass.data.pop(key, None)
+    await template.async_load_bytecode_cache(hass)
+    with patch.object(
+        jinja2.Environment, "compile", side_effect=AssertionError
+    ) as compile_mock:
+        assert template.Template(source, hass).async_render() == 2
+    assert not compile_mock.called
+
+    # The limited environment does not share the compiled code
+    limited = template.Template(source, hass)
+    with pytest.raises(TemplateError):
+        limited.async_render(limited=True)
+
+
+@pytest.mark.parametrize("load_template_bytecode_cache", [True])
+@pytest.mark.parametrize("content", [b"", b"not a cache", b"\x00" * 32])
+async def test_bytecode_cache_invalid_file(
+    hass: HomeAssistant, tmp_path: Path, content: bytes
+) -> None:
+    """Test an invalid or outdated bytecode cache is discarded."""
+    hass.config.config_dir = str(tmp_path)
+    storage_path = tmp_path / ".storage"
+    storage_path.mkdir()
+    (storage_path / template.TEMPLATE_BYTECODE_FILE).write_bytes(content)
+    await template.async_load_bytecode_cache(hass)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+
+
 def test_loop_controls(hass: HomeAssistant) -> None:
     """Test that loop controls are enabled."""
     assert (